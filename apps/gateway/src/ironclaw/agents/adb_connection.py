@@ -4,6 +4,7 @@ Provides utilities for connecting to Android devices via ADB.
 """
 import logging
 import re
+import shlex
 from typing import Optional
 
 from droidrun.tools.android.adb import AdbTools
@@ -97,6 +98,15 @@ class ADBConnection:
             logger.warning(f"ADB shell stderr: {result.stderr.strip()}")
         return result.stdout.strip()
 
+    async def shell_argv(self, argv: list[str]) -> str:
+        """
+        Execute a pre-split command on the device.
+
+        The device side of ``adb shell`` always re-parses its arguments, so each
+        one is shell-quoted to reach the command verbatim (spaces, quotes, ``$``).
+        """
+        return await self.shell(shlex.join(argv))
+
     async def start_app(self, package: str) -> str:
         """Start an app by package name."""
         tools = await self.get_tools()
@@ -138,6 +148,28 @@ class ADBConnection:
             logger.error(f"Failed to push file: {e}")
             return False
 
+    async def push_bytes(self, data: bytes, remote_path: str) -> bool:
+        """Write in-memory data to a file on the device, without a local copy."""
+        import subprocess
+        settings = get_settings()
+
+        adb_cmd = ["adb"]
+        if settings.device_serial:
+            adb_cmd.extend(["-s", settings.device_serial])
+        # exec-in pipes stdin to the device unmodified (no pty), so binary data survives
+        adb_cmd.extend(["exec-in", f"cat > {shlex.quote(remote_path)}"])
+
+        try:
+            logger.info(f"Executing ADB exec-in: {' '.join(adb_cmd)} ({len(data)} bytes)")
+            result = subprocess.run(adb_cmd, input=data, capture_output=True, timeout=60)
+            if result.stderr:
+                logger.warning(f"ADB exec-in stderr: {result.stderr.decode(errors='replace').strip()}")
+            logger.info(f"ADB exec-in return code: {result.returncode}")
+            return result.returncode == 0
+        except Exception as e:
+            logger.error(f"Failed to push bytes: {e}")
+            return False
+
     async def get_location(self) -> Optional[dict]:
         """
         Get device GPS location.
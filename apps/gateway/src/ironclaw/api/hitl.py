@@ -2,6 +2,7 @@
 HITL (Human-in-the-Loop) API endpoints.
 Allows users to view and respond to intervention requests.
 """
+import base64
 import logging
 from typing import Optional
 
@@ -46,7 +47,7 @@ async def get_pending_requests(task_id: Optional[str] = None):
     result = []
     for req in requests:
         req_copy = req.copy()
-        req_copy["has_screenshot"] = bool(req_copy.pop("screenshot_base64", None))
+        req_copy["has_screenshot"] = bool(req_copy.pop("screenshot_bytes", None))
         result.append(req_copy)
 
     return {"requests": result}
@@ -61,9 +62,13 @@ async def get_request(request_id: str):
     if not request:
         raise HTTPException(status_code=404, detail="HITL request not found")
 
-    # Include screenshot availability
+    # Include screenshot availability; the screenshot itself stays inline as base64
     request_copy = request.copy()
-    request_copy["has_screenshot"] = bool(request_copy.get("screenshot_base64"))
+    screenshot = request_copy.pop("screenshot_bytes", None)
+    request_copy["screenshot_base64"] = (
+        base64.b64encode(screenshot).decode("ascii") if screenshot else None
+    )
+    request_copy["has_screenshot"] = bool(screenshot)
 
     return request_copy
 
@@ -77,11 +82,11 @@ async def get_screenshot(request_id: str):
     if not request:
         raise HTTPException(status_code=404, detail="HITL request not found")
 
-    screenshot = request.get("screenshot_base64")
+    screenshot = request.get("screenshot_bytes")
     if not screenshot:
         raise HTTPException(status_code=404, detail="No screenshot available")
 
-    return {"screenshot_base64": screenshot}
+    return {"screenshot_base64": base64.b64encode(screenshot).decode("ascii")}
 
 
 @router.post("/{request_id}/respond")
@@ -21,6 +21,7 @@ from ..services.openclaw_service import (
     WebhookResponse,
     TaskInfo,
     TaskStatus,
+    TokenError,
     init_openclaw_service,
     get_openclaw_service,
 )
@@ -41,6 +42,8 @@ else:
         current = current.parent
 
 logger = logging.getLogger("ironclaw.api.openclaw")
+# Every route declares a response_model and keeps the default response class, so
+# FastAPI serializes straight to JSON bytes in pydantic-core (no ORJSONResponse needed)
 router = APIRouter()
 
 
@@ -62,7 +65,7 @@ def _get_hook_token() -> str:
 try:
     _service = init_openclaw_service(_get_hook_token())
 except Exception as e:
-    logger.error(f"Failed to initialize OpenClaw service: {e}")
+    logger.error("Failed to initialize OpenClaw service: %s", e)
     _service = None
 
 
@@ -73,6 +76,14 @@ class TaskListResponse(BaseModel):
     total: int
 
 
+class OpenClawHealthResponse(BaseModel):
+    """Response for the OpenClaw health check."""
+    ok: bool
+    service: str
+    status: str
+    version: str
+
+
 class TaskStatusRequest(BaseModel):
     """Request to query task status."""
     runId: Optional[str] = None
@@ -103,6 +114,7 @@ async def openclaw_webhook(
     - 401: Missing authorization header
     - 403: Invalid token
     - 400: Invalid request payload
+    - 503: Too many tasks queued; retry later
     """
     if _service is None:
         raise HTTPException(
@@ -111,25 +123,32 @@ async def openclaw_webhook(
         )
 
     # Log incoming request (structured JSON logging)
-    logger.info(
-        "Received OpenClaw webhook",
-        extra={
-            "task_id": payload.taskId,
-            "type": payload.type,
-            "step_type": payload.payload.stepType,
-            "source": payload.metadata.source if payload.metadata else "unknown",
-        },
-    )
+    if logger.isEnabledFor(logging.INFO):
+        logger.info(
+            "Received OpenClaw webhook",
+            extra={
+                "task_id": payload.taskId,
+                "type": payload.type,
+                "step_type": payload.payload.stepType,
+                "source": payload.metadata.source if payload.metadata else "unknown",
+            },
+        )
+
+    # 401 when no Bearer credential was sent, 403 when it does not match
+    token_error = _service.check_token(authorization)
+    if token_error is TokenError.MISSING:
+        raise HTTPException(status_code=401, detail="Missing authorization token")
+    if token_error is TokenError.INVALID:
+        raise HTTPException(status_code=403, detail="Invalid authorization token")
 
     # Handle the webhook
     response = await _service.handle_webhook(payload, authorization)
 
     # Return appropriate HTTP status
     if not response.ok:
-        if "authorization" in (response.error or "").lower():
-            raise HTTPException(status_code=401, detail=response.error)
-        elif "invalid" in (response.error or "").lower() and "token" in (response.error or "").lower():
-            raise HTTPException(status_code=403, detail=response.error)
+        # "rejected" is backpressure (the backlog is full); anything else is a bad request
+        if response.status == "rejected":
+            raise HTTPException(status_code=503, detail=response.error)
         else:
             raise HTTPException(status_code=400, detail=response.error)
 
@@ -262,16 +281,16 @@ async def cancel_task(
 
 
 # Health check for the OpenClaw integration
-@router.get("/health")
+@router.get("/health", response_model=OpenClawHealthResponse)
 async def openclaw_health():
     """
     Health check for OpenClaw webhook integration.
 
     Returns service status and configuration info.
     """
-    return {
-        "ok": True,
-        "service": "openclaw-webhook",
-        "status": "ready" if _service else "not_initialized",
-        "version": "1.0.0",
-    }
+    return OpenClawHealthResponse(
+        ok=True,
+        service="openclaw-webhook",
+        status="ready" if _service else "not_initialized",
+        version="1.0.0",
+    )
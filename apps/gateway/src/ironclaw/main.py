@@ -9,6 +9,9 @@ from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
 from .api import alarms, health, hitl, jobs, tabs, wake, chat, chat_cloud, speech, mobilerun, mobilerun_ws, openclaw, google_sheets
+from .services.execution_service import shutdown_execution_service
+from .services.hitl_service import shutdown_hitl_service
+from .services.openclaw_service import shutdown_openclaw_service
 from .utils.config import get_settings
 
 # Configure logging
@@ -34,6 +37,9 @@ async def lifespan(app: FastAPI):
     yield
 
     logger.info("🦾 Iron Claw Gateway shutting down...")
+    await shutdown_execution_service()
+    await shutdown_hitl_service()
+    await shutdown_openclaw_service()
 
 
 def create_app() -> FastAPI:
@@ -1,6 +1,7 @@
 """
 Job Hunter Module - Resume parsing and job application automation.
 """
+import io
 import json
 import logging
 from datetime import datetime
@@ -56,24 +57,55 @@ class JobHunterService:
 
         logger.info(f"Saved resume to {file_path}")
 
-        # Extract text from PDF
+        bio_memory = self._save_bio_memory(str(file_path), self._extract_text(content, filename))
+
+        # Push resume to device
+        await self.adb.push_file(
+            str(file_path),
+            f"/sdcard/Download/{file.filename}"
+        )
+        logger.info("Resume pushed to device /sdcard/Download/")
+
+        return bio_memory
+
+    async def parse_resume_bytes(self, data: bytes, filename: str) -> dict:
+        """
+        Parse a resume PDF held in memory, without writing it to disk.
+
+        Same result as parse_resume; the PDF goes straight to the device and
+        bio-memory records its path there.
+        """
+        device_path = f"/sdcard/Download/{filename}"
+        bio_memory = self._save_bio_memory(device_path, self._extract_text(data, filename))
+
+        await self.adb.push_bytes(bytes(data), device_path)
+        logger.info("Resume pushed to device /sdcard/Download/")
+
+        return bio_memory
+
+    def _extract_text(self, content: bytes, filename: str) -> str:
+        """Extract text from PDF bytes."""
         try:
             from PyPDF2 import PdfReader
 
-            reader = PdfReader(str(file_path))
+            reader = PdfReader(io.BytesIO(content))
             text = ""
             for page in reader.pages:
                 text += page.extract_text() or ""
 
         except ImportError:
             # Fallback: just read raw bytes for now
-            text = f"[Resume uploaded: {file.filename}]"
+            text = f"[Resume uploaded: {filename}]"
             logger.warning("PyPDF2 not available, using placeholder text")
 
+        return text
+
+    def _save_bio_memory(self, resume_file: str, text: str) -> dict:
+        """Build the bio-memory for a parsed resume and save it for the agent."""
         # For MVP: Create a simple structured format
         # In production, use LLM to extract structured data
         bio_memory = {
-            "resume_file": str(file_path),
+            "resume_file": resume_file,
             "resume_text": text[:2000],  # Truncate for context window
             "parsed_at": datetime.now().isoformat(),
         }
@@ -83,13 +115,6 @@ class JobHunterService:
         with open(bio_memory_path, "w") as f:
             json.dump(bio_memory, f, indent=2)
 
-        # Push resume to device
-        await self.adb.push_file(
-            str(file_path),
-            f"/sdcard/Download/{file.filename}"
-        )
-        logger.info("Resume pushed to device /sdcard/Download/")
-
         return bio_memory
 
     async def search_and_apply(
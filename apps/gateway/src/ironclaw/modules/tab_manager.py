@@ -12,6 +12,7 @@ import json
 import logging
 import os
 import uuid
+from dataclasses import asdict
 from datetime import datetime
 from pathlib import Path
 from typing import Dict, List, Optional
@@ -151,7 +152,7 @@ class TabManagerService:
 
             return {
                 "success": result.success,
-                "tabs": [t.__dict__ for t in result.tabs] if result.tabs else [],
+                "tabs": [asdict(t) for t in result.tabs] if result.tabs else [],
                 "count": len(result.tabs) if result.tabs else 0,
                 "task_id": result.task_id,
                 "error": result.error,
@@ -6,14 +6,77 @@ import asyncio
 import base64
 import io
 import logging
+import re
+import sqlite3
+from pathlib import Path
+from typing import Optional
 
 from ..services.hitl_service import get_hitl_service
 from ..utils.config import get_settings
 
 logger = logging.getLogger("ironclaw.modules.telegram_bot")
 
-# Store chat_id for notifications (in production, use a database)
-_registered_chat_ids: set[int] = set()
+# Registered chat_ids for notifications, persisted so they survive restarts
+_CHAT_DB_PATH = Path(__file__).parent.parent.parent.parent / "data" / "telegram_chats.db"
+_chat_db: Optional[sqlite3.Connection] = None
+
+
+def _get_chat_db() -> sqlite3.Connection:
+    """Get or open the chat registry database."""
+    global _chat_db
+    if _chat_db is None:
+        _CHAT_DB_PATH.parent.mkdir(parents=True, exist_ok=True)
+        _chat_db = sqlite3.connect(_CHAT_DB_PATH, isolation_level=None, check_same_thread=False)
+        _chat_db.execute("PRAGMA journal_mode=WAL")
+        _chat_db.execute("CREATE TABLE IF NOT EXISTS chats (chat_id INTEGER PRIMARY KEY)")
+    return _chat_db
+
+
+def _register_chat(chat_id: int) -> None:
+    """Register a chat for HITL notifications."""
+    _get_chat_db().execute("INSERT OR IGNORE INTO chats (chat_id) VALUES (?)", (chat_id,))
+
+
+def _get_registered_chat_ids() -> list[int]:
+    """Get all chats registered for HITL notifications."""
+    return [row[0] for row in _get_chat_db().execute("SELECT chat_id FROM chats")]
+
+# /alarm argument: H:MM or HH:MM on a 24-hour clock
+_ALARM_TIME_RE = re.compile(r"^(2[0-3]|[01]?\d):([0-5]\d)$")
+
+# Markdown reply to /start
+_START_HELP_TEXT = (
+    "🦾 *Iron Claw* - Mobile-First Autonomous Agent\n\n"
+    "You are now registered for notifications.\n\n"
+    "*Commands:*\n"
+    "• `/apply <query>` - Search and apply for jobs\n"
+    "• `/alarm <HH:MM>` - Set an alarm\n"
+    "• `/wake` - Trigger wake-up call now\n"
+    "• `/screenshot` - See device screen\n"
+    "• `/hitl` - View pending interventions\n"
+    "• Send a PDF to upload your resume\n"
+)
+
+# Markdown body for HITL notifications, filled from the HITL request dict
+_HITL_MESSAGE_TEMPLATE = (
+    "🚨 *Human Intervention Required*\n\n"
+    "*Type:* {hitl_type}\n"
+    "*Task:* {task_id}\n\n"
+    "*Message:* {message}\n"
+)
+
+# (InlineKeyboardButton, InlineKeyboardMarkup), resolved on first HITL notification
+_keyboard_classes: Optional[tuple[type, type]] = None
+
+
+def _get_keyboard_classes() -> tuple[type, type]:
+    """Get the Telegram inline keyboard classes, importing them once."""
+    global _keyboard_classes
+    if _keyboard_classes is None:
+        from telegram import InlineKeyboardButton, InlineKeyboardMarkup
+
+        _keyboard_classes = (InlineKeyboardButton, InlineKeyboardMarkup)
+    return _keyboard_classes
 
 
 class TelegramBotService:
@@ -86,30 +149,30 @@ class TelegramBotService:
             logger.warning("Bot not initialized, cannot send HITL notification")
             return
 
-        from telegram import InlineKeyboardButton, InlineKeyboardMarkup
+        InlineKeyboardButton, InlineKeyboardMarkup = _get_keyboard_classes()
 
         request_id = request["request_id"]
-        message = (
-            f"🚨 *Human Intervention Required*\n\n"
-            f"*Type:* {request['hitl_type']}\n"
-            f"*Task:* {request['task_id']}\n\n"
-            f"*Message:* {request['message']}\n"
-        )
+        message = _HITL_MESSAGE_TEMPLATE.format_map(request)
 
         # Build inline keyboard with options
-        buttons = []
-        for option in request["options"]:
-            callback_data = f"hitl:{request_id}:{option}"
-            buttons.append([InlineKeyboardButton(option, callback_data=callback_data)])
+        callback_prefix = f"hitl:{request_id}:"
+        buttons = [
+            [InlineKeyboardButton(option, callback_data=callback_prefix + option)]
+            for option in request["options"]
+        ]
 
         keyboard = InlineKeyboardMarkup(buttons)
 
+        # In-process requests carry raw bytes; only decode base64 from other producers
+        screenshot_bytes = request.get("screenshot_bytes")
+        if not screenshot_bytes and request.get("screenshot_base64"):
+            screenshot_bytes = base64.b64decode(request["screenshot_base64"])
+
         # Send to all registered chats
-        for chat_id in _registered_chat_ids:
+        for chat_id in _get_registered_chat_ids():
             try:
                 # Send screenshot if available
-                if request.get("screenshot_base64"):
-                    screenshot_bytes = base64.b64decode(request["screenshot_base64"])
+                if screenshot_bytes:
                     await self._bot.send_photo(
                         chat_id,
                         photo=io.BytesIO(screenshot_bytes),
@@ -157,20 +220,9 @@ class TelegramBotService:
     async def _handle_start(self, update, context):
         """Handle /start command."""
         chat_id = update.effective_chat.id
-        _registered_chat_ids.add(chat_id)
-
-        await update.message.reply_text(
-            "🦾 *Iron Claw* - Mobile-First Autonomous Agent\n\n"
-            "You are now registered for notifications.\n\n"
-            "*Commands:*\n"
-            "• `/apply <query>` - Search and apply for jobs\n"
-            "• `/alarm <HH:MM>` - Set an alarm\n"
-            "• `/wake` - Trigger wake-up call now\n"
-            "• `/screenshot` - See device screen\n"
-            "• `/hitl` - View pending interventions\n"
-            "• Send a PDF to upload your resume\n",
-            parse_mode="Markdown",
-        )
+        _register_chat(chat_id)
+
+        await update.message.reply_text(_START_HELP_TEXT, parse_mode="Markdown")
 
     async def _handle_apply(self, update, context):
         """Handle /apply command."""
@@ -203,16 +255,13 @@ class TelegramBotService:
 
     async def _handle_alarm(self, update, context):
         """Handle /alarm command."""
-        time_str = context.args[0] if context.args else None
-        if not time_str or ":" not in time_str:
+        time_str = context.args[0] if context.args else ""
+        match = _ALARM_TIME_RE.match(time_str)
+        if not match:
             await update.message.reply_text("Usage: /alarm 07:00")
             return
 
-        try:
-            hour, minute = map(int, time_str.split(":"))
-        except ValueError:
-            await update.message.reply_text("Invalid time format. Use HH:MM")
-            return
+        hour, minute = int(match[1]), int(match[2])
 
         from .temporal_guardian import TemporalGuardianService
         service = TemporalGuardianService()
@@ -285,10 +334,19 @@ class TelegramBotService:
 
         await update.message.reply_text("📄 Processing resume...")
 
-        # Download file
+        # Download into memory and hand the bytes straight to the parser
         file = await context.bot.get_file(document.file_id)
-        file_path = f"/tmp/{document.file_name}"
-        await file.download_to_drive(file_path)
+        data = await file.download_as_bytearray()
+
+        from .job_hunter import JobHunterService
+        service = JobHunterService()
+
+        try:
+            await service.parse_resume_bytes(data, Path(document.file_name).name)
+        except Exception as e:
+            logger.error(f"Failed to process resume: {e}")
+            await update.message.reply_text(f"❌ Failed to process resume: {e}")
+            return
 
         await update.message.reply_text("✅ Resume received and saved!")
 
@@ -14,6 +14,13 @@ from .schedule_extractor import ScheduleEvent
 
 logger = logging.getLogger("ironclaw.modules.temporal_guardian")
 
+_DAY_INDEX = {
+    name: index
+    for index, name in enumerate(
+        ["monday", "tuesday", "wednesday", "thursday", "friday", "saturday", "sunday"]
+    )
+}
+
 
 class TemporalGuardianService:
     """
@@ -53,18 +60,18 @@ class TemporalGuardianService:
         skip_ui = self.config.get("skip_ui", True)
 
         # Build the intent command
-        cmd = (
-            f"am start -a android.intent.action.SET_ALARM "
-            f"--ei android.intent.extra.alarm.HOUR {hour} "
-            f"--ei android.intent.extra.alarm.MINUTES {minute} "
-            f'--es android.intent.extra.alarm.MESSAGE "{label}" '
-            f"--ez android.intent.extra.alarm.SKIP_UI {str(skip_ui).lower()}"
-        )
+        argv = [
+            "am", "start", "-a", "android.intent.action.SET_ALARM",
+            "--ei", "android.intent.extra.alarm.HOUR", str(hour),
+            "--ei", "android.intent.extra.alarm.MINUTES", str(minute),
+            "--es", "android.intent.extra.alarm.MESSAGE", label,
+            "--ez", "android.intent.extra.alarm.SKIP_UI", str(skip_ui).lower(),
+        ]
 
         logger.info(f"Setting alarm for {hour:02d}:{minute:02d} - {label}")
 
         try:
-            result = await self.adb.shell(cmd)
+            result = await self.adb.shell_argv(argv)
             logger.info(f"Alarm set result: {result}")
 
             # Give the alarm app time to process
@@ -111,21 +118,21 @@ class TemporalGuardianService:
             end_millis = start_millis + (60 * 60 * 1000)
 
         # Build calendar intent
-        cmd = (
-            f"am start -a android.intent.action.INSERT "
-            f"-d content://com.android.calendar/events "
-            f"--el beginTime {start_millis} "
-            f"--el endTime {end_millis} "
-            f'--es title "{title}"'
-        )
+        argv = [
+            "am", "start", "-a", "android.intent.action.INSERT",
+            "-d", "content://com.android.calendar/events",
+            "--el", "beginTime", str(start_millis),
+            "--el", "endTime", str(end_millis),
+            "--es", "title", title,
+        ]
 
         if description:
-            cmd += f' --es description "{description}"'
+            argv += ["--es", "description", description]
 
         logger.info(f"Creating calendar event: {title} at {start_time}")
 
         try:
-            result = await self.adb.shell(cmd)
+            result = await self.adb.shell_argv(argv)
             logger.info(f"Calendar event result: {result}")
 
             await asyncio.sleep(2)
@@ -155,14 +162,12 @@ class TemporalGuardianService:
 
     def _get_next_weekday(self, day_name: str) -> datetime:
         """Get the date of the next occurrence of the given day name."""
-        days = ["monday", "tuesday", "wednesday", "thursday", "friday", "saturday", "sunday"]
-        try:
-            target_day_index = days.index(day_name.lower())
-        except ValueError:
+        today = datetime.now()
+        target_day_index = _DAY_INDEX.get(day_name.lower())
+        if target_day_index is None:
             logger.warning(f"Invalid day name: {day_name}, defaulting to tomorrow")
-            return datetime.now() + timedelta(days=1)
+            return today + timedelta(days=1)
 
-        today = datetime.now()
         current_day_index = today.weekday()
 
         days_ahead = target_day_index - current_day_index
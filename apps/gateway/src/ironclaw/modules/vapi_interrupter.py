@@ -2,33 +2,54 @@
 Vapi Interrupter Module - Voice AI wake-up calls.
 Uses Vapi REST API directly for server-side outbound calls.
 """
+import asyncio
 import logging
 import random
 import uuid
 from datetime import datetime
-from typing import Optional
-
-import httpx
-from apscheduler.schedulers.asyncio import AsyncIOScheduler
-from apscheduler.triggers.cron import CronTrigger
+from typing import TYPE_CHECKING, Optional
 
 from ..agents.adb_connection import ADBConnection
 from ..utils.config import get_app_config, get_settings
 
+if TYPE_CHECKING:
+    from apscheduler.schedulers.asyncio import AsyncIOScheduler
+
 logger = logging.getLogger("ironclaw.modules.vapi_interrupter")
 
+try:
+    import orjson
+
+    _json_dumps = orjson.dumps
+    _json_loads = orjson.loads
+except ImportError:
+    import json
+
+    def _json_dumps(obj) -> bytes:
+        return json.dumps(obj).encode("utf-8")
+
+    _json_loads = json.loads
+
 # Vapi API base URL
 VAPI_API_URL = "https://api.vapi.ai"
 
 # Global scheduler instance
-_scheduler: Optional[AsyncIOScheduler] = None
+_scheduler: Optional["AsyncIOScheduler"] = None
 
 
-def get_scheduler() -> AsyncIOScheduler:
-    """Get or create the global scheduler."""
+def get_scheduler() -> "AsyncIOScheduler":
+    """Get or create the global scheduler. Must be called from the running event loop."""
     global _scheduler
     if _scheduler is None:
-        _scheduler = AsyncIOScheduler()
+        # Imported lazily - apscheduler is only needed once a call is scheduled
+        from apscheduler.executors.asyncio import AsyncIOExecutor
+        from apscheduler.schedulers.asyncio import AsyncIOScheduler
+
+        # Bind to the serving loop and run coroutine jobs as tasks on it directly
+        _scheduler = AsyncIOScheduler(
+            executors={"default": AsyncIOExecutor()},
+            event_loop=asyncio.get_running_loop(),
+        )
         _scheduler.start()
     return _scheduler
 
@@ -132,6 +153,8 @@ Remember: You're helping them achieve their goals. Being firm is being kind.
         Returns:
             Call ID from Vapi
         """
+        import httpx
+
         logger.info(f"🔔 Triggering wake-up call to {phone_number}")
 
         assistant_config = self._build_wake_assistant_config(
@@ -155,10 +178,10 @@ Remember: You're helping them achieve their goals. Being firm is being kind.
                 response = await client.post(
                     f"{VAPI_API_URL}/call",
                     headers=self._get_headers(),
-                    json=payload,
+                    content=_json_dumps(payload),
                 )
                 response.raise_for_status()
-                data = response.json()
+                data = _json_loads(response.content)
 
             call_id = data.get("id", "unknown")
             logger.info(f"✅ Wake-up call initiated: {call_id}")
@@ -190,6 +213,8 @@ Remember: You're helping them achieve their goals. Being firm is being kind.
         Returns:
             Job ID for the scheduled task
         """
+        from apscheduler.triggers.cron import CronTrigger
+
         # Determine timezone
         if use_device_location:
             location = await self.get_device_location()
@@ -201,7 +226,7 @@ Remember: You're helping them achieve their goals. Being firm is being kind.
 
         scheduler = get_scheduler()
 
-        # Create unique job ID
+        # Random job ID - unique in practice, so no replace_existing lookup is needed
         job_id = f"wake-{uuid.uuid4().hex[:8]}"
 
         # Schedule the job
@@ -211,7 +236,6 @@ Remember: You're helping them achieve their goals. Being firm is being kind.
             args=[phone_number],
             id=job_id,
             name=f"Wake Call {hour:02d}:{minute:02d}",
-            replace_existing=True,
         )
 
         logger.info(f"✅ Wake-up call scheduled: {job_id}")
@@ -250,6 +274,8 @@ Remember: You're helping them achieve their goals. Being firm is being kind.
 
     async def list_calls(self, limit: int = 10) -> list:
         """List recent calls from Vapi."""
+        import httpx
+
         try:
             async with httpx.AsyncClient(timeout=30.0) as client:
                 response = await client.get(
@@ -258,7 +284,7 @@ Remember: You're helping them achieve their goals. Being firm is being kind.
                     params={"limit": limit},
                 )
                 response.raise_for_status()
-                return response.json()
+                return _json_loads(response.content)
         except Exception as e:
             logger.error(f"Failed to list calls: {e}")
             return []
@@ -7,14 +7,20 @@ Handles command execution with:
 """
 import asyncio
 import logging
-import subprocess
-import shutil
+import time
 from typing import Optional, AsyncIterator
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from enum import Enum
 
 logger = logging.getLogger("ironclaw.services.execution")
 
+# Sent to the persistent `adb shell`: prints the PNG size on one line, then the raw PNG
+_SCREENCAP_PATH = "/data/local/tmp/ironclaw_screen.png"
+_SCREENCAP_COMMAND = (
+    f"screencap -p {_SCREENCAP_PATH} && stat -c %s {_SCREENCAP_PATH} "
+    f"&& cat {_SCREENCAP_PATH} || echo -1\n"
+).encode()
+
 
 class ExecutionBackend(str, Enum):
     """Available execution backends."""
@@ -23,7 +29,7 @@ class ExecutionBackend(str, Enum):
     NONE = "none"
 
 
-@dataclass
+@dataclass(slots=True)
 class ExecutionResult:
     """Result from command execution."""
     success: bool
@@ -31,13 +37,9 @@ class ExecutionResult:
     output: Optional[str] = None
     error: Optional[str] = None
     task_id: Optional[str] = None
-    screenshots: list[str] = None
+    screenshots: list[str] = field(default_factory=list)
     steps: int = 0
 
-    def __post_init__(self):
-        if self.screenshots is None:
-            self.screenshots = []
-
 
 class ExecutionService:
     """
@@ -60,6 +62,8 @@ class ExecutionService:
         result = await service.execute("Open settings and increase font size")
     """
 
+    BACKEND_CACHE_TTL = 30.0  # seconds
+
     def __init__(
         self,
         mobilerun_api_key: Optional[str] = None,
@@ -67,6 +71,7 @@ class ExecutionService:
         mobilerun_base_url: str = "https://api.mobilerun.ai",
         local_device_serial: Optional[str] = None,
         prefer_local: bool = False,
+        probe_timeout: float = 2.0,
     ):
         """
         Initialize execution service.
@@ -77,15 +82,20 @@ class ExecutionService:
             mobilerun_base_url: MobileRun API URL
             local_device_serial: Local ADB device serial (optional)
             prefer_local: If True, prefer local DroidRun over cloud
+            probe_timeout: Seconds allowed for each backend availability probe
         """
         self.mobilerun_api_key = mobilerun_api_key
         self.mobilerun_device_id = mobilerun_device_id
         self.mobilerun_base_url = mobilerun_base_url
         self.local_device_serial = local_device_serial
         self.prefer_local = prefer_local
+        self.probe_timeout = probe_timeout
 
         self._mobilerun_client = None
-        self._backend_cache: Optional[ExecutionBackend] = None
+        self._adb_shell: Optional[asyncio.subprocess.Process] = None
+        self._adb_shell_lock = asyncio.Lock()
+        # (backend, time.monotonic() expiry)
+        self._backend_cache: Optional[tuple[ExecutionBackend, float]] = None
 
     def _get_mobilerun_client(self):
         """Get or create MobileRun client."""
@@ -107,37 +117,75 @@ class ExecutionService:
             if client:
                 return await client.ping()
         except Exception as e:
-            logger.warning(f"MobileRun not available: {e}")
+            logger.warning("MobileRun not available: %s", e)
         return False
 
     async def check_droidrun_available(self) -> bool:
         """Check if local DroidRun CLI is available with a connected device."""
+        import shutil
+
         # Check if droidrun CLI is installed
         if not shutil.which("droidrun"):
             logger.info("DroidRun CLI not found in PATH")
             return False
 
+        # Check for a connected device with `adb devices` (no agent run needed)
         try:
-            # Try a simple command to test connectivity
-            result = await asyncio.to_thread(
-                subprocess.run,
-                ["droidrun", "run", "echo test", "--steps", "1"],
-                capture_output=True,
-                text=True,
-                timeout=30,
+            proc = await asyncio.create_subprocess_exec(
+                "adb", "devices",
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.PIPE,
             )
-            # If it fails with "no device", return False
-            if "no device" in result.stderr.lower() or "not found" in result.stderr.lower():
-                logger.info("No local device connected for DroidRun")
+            try:
+                stdout, _ = await asyncio.wait_for(proc.communicate(), timeout=2.0)
+            except asyncio.TimeoutError:
+                logger.warning("adb devices check timed out")
                 return False
-            return True
-        except subprocess.TimeoutExpired:
-            logger.warning("DroidRun check timed out")
+            finally:
+                # Also runs when _probe_all's outer timeout cancels us first;
+                # without it a hung adb is left running and unreaped.
+                if proc.returncode is None:
+                    proc.kill()
+                    await proc.wait()
+        except FileNotFoundError:
+            logger.info("adb not found in PATH")
             return False
         except Exception as e:
-            logger.warning(f"DroidRun check failed: {e}")
+            logger.warning("DroidRun check failed: %s", e)
             return False
 
+        # Device rows are "<serial>\t<state>"; the header and daemon notices have no tab
+        for line in stdout.decode(errors="replace").splitlines():
+            serial, _, state = line.strip().partition("\t")
+            if state != "device":
+                continue
+            if self.local_device_serial is None or serial == self.local_device_serial:
+                return True
+
+        logger.info("No local device connected for DroidRun")
+        return False
+
+    async def _probe_all(self) -> dict[ExecutionBackend, bool]:
+        """
+        Probe both backends concurrently.
+
+        Each probe is bounded by probe_timeout, so a hung backend cannot
+        stall the other; timeouts and errors count as unavailable.
+        """
+        results = await asyncio.gather(
+            asyncio.wait_for(self.check_mobilerun_available(), self.probe_timeout),
+            asyncio.wait_for(self.check_droidrun_available(), self.probe_timeout),
+            return_exceptions=True,
+        )
+        for name, result in zip(("MobileRun", "DroidRun"), results):
+            if isinstance(result, BaseException):
+                logger.warning("%s availability probe failed: %r", name, result)
+        mobilerun_ok, droidrun_ok = (result is True for result in results)
+        return {
+            ExecutionBackend.MOBILERUN_CLOUD: mobilerun_ok,
+            ExecutionBackend.DROIDRUN_LOCAL: droidrun_ok,
+        }
+
     async def get_available_backend(self, force_refresh: bool = False) -> ExecutionBackend:
         """
         Determine the best available backend.
@@ -146,26 +194,23 @@ class ExecutionService:
             ExecutionBackend enum indicating which backend to use
         """
         if self._backend_cache and not force_refresh:
-            return self._backend_cache
+            backend, expires_at = self._backend_cache
+            if time.monotonic() < expires_at:
+                return backend
 
-        # Check backends based on preference
+        available = await self._probe_all()
         if self.prefer_local:
-            if await self.check_droidrun_available():
-                self._backend_cache = ExecutionBackend.DROIDRUN_LOCAL
-                return self._backend_cache
-            if await self.check_mobilerun_available():
-                self._backend_cache = ExecutionBackend.MOBILERUN_CLOUD
-                return self._backend_cache
+            order = (ExecutionBackend.DROIDRUN_LOCAL, ExecutionBackend.MOBILERUN_CLOUD)
         else:
-            if await self.check_mobilerun_available():
-                self._backend_cache = ExecutionBackend.MOBILERUN_CLOUD
-                return self._backend_cache
-            if await self.check_droidrun_available():
-                self._backend_cache = ExecutionBackend.DROIDRUN_LOCAL
-                return self._backend_cache
+            order = (ExecutionBackend.MOBILERUN_CLOUD, ExecutionBackend.DROIDRUN_LOCAL)
+        backend = next((b for b in order if available[b]), ExecutionBackend.NONE)
+
+        self._backend_cache = (backend, time.monotonic() + self.BACKEND_CACHE_TTL)
+        return backend
 
-        self._backend_cache = ExecutionBackend.NONE
-        return self._backend_cache
+    def invalidate_backend_cache(self) -> None:
+        """Force the next get_available_backend() call to re-probe."""
+        self._backend_cache = None
 
     async def execute(
         self,
@@ -190,13 +235,17 @@ class ExecutionService:
         Returns:
             ExecutionResult with success status and output
         """
-        backend = force_backend or await self.get_available_backend()
+        if force_backend:
+            # Normalise plain strings so the identity checks below hold
+            backend = ExecutionBackend(force_backend)
+        else:
+            backend = await self.get_available_backend()
 
-        logger.info(f"Executing on {backend.value}: {command[:50]}...")
+        logger.info("Executing on %s: %s...", backend.value, command[:50])
 
-        if backend == ExecutionBackend.MOBILERUN_CLOUD:
+        if backend is ExecutionBackend.MOBILERUN_CLOUD:
             return await self._execute_mobilerun(command, max_steps, vision, reasoning, llm_model)
-        elif backend == ExecutionBackend.DROIDRUN_LOCAL:
+        elif backend is ExecutionBackend.DROIDRUN_LOCAL:
             return await self._execute_droidrun(command, max_steps, vision, reasoning)
         else:
             return ExecutionResult(
@@ -236,13 +285,32 @@ class ExecutionService:
                 steps=0,
             )
         except Exception as e:
-            logger.error(f"MobileRun execution failed: {e}", exc_info=True)
+            logger.error("MobileRun execution failed: %s", e, exc_info=True)
+            self.invalidate_backend_cache()
             return ExecutionResult(
                 success=False,
                 backend=ExecutionBackend.MOBILERUN_CLOUD,
                 error=str(e),
             )
 
+    def _droidrun_command(
+        self,
+        command: str,
+        max_steps: int,
+        vision: bool,
+        reasoning: bool,
+    ) -> list[str]:
+        """Build the DroidRun CLI argv."""
+        cmd = ["droidrun", "run", command, "--steps", str(max_steps)]
+
+        if vision:
+            cmd.append("--vision")
+        if reasoning:
+            cmd.append("--reasoning")
+        if self.local_device_serial:
+            cmd.extend(["--device", self.local_device_serial])
+        return cmd
+
     async def _execute_droidrun(
         self,
         command: str,
@@ -252,40 +320,40 @@ class ExecutionService:
     ) -> ExecutionResult:
         """Execute via local DroidRun CLI."""
         try:
-            cmd = ["droidrun", "run", command, "--steps", str(max_steps)]
-
-            if vision:
-                cmd.append("--vision")
-            if reasoning:
-                cmd.append("--reasoning")
-            if self.local_device_serial:
-                cmd.extend(["--device", self.local_device_serial])
-
-            result = await asyncio.to_thread(
-                subprocess.run,
-                cmd,
-                capture_output=True,
-                text=True,
-                timeout=300,
+            cmd = self._droidrun_command(command, max_steps, vision, reasoning)
+            proc = await asyncio.create_subprocess_exec(
+                *cmd,
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.PIPE,
             )
+            try:
+                stdout, stderr = await asyncio.wait_for(proc.communicate(), timeout=300)
+            except asyncio.TimeoutError:
+                proc.kill()
+                await proc.wait()
+                self.invalidate_backend_cache()
+                return ExecutionResult(
+                    success=False,
+                    backend=ExecutionBackend.DROIDRUN_LOCAL,
+                    error="Command execution timed out (300s)",
+                )
 
-            success = result.returncode == 0
-            output = result.stdout if success else result.stderr
+            stdout_text = stdout.decode(errors="replace")
+            stderr_text = stderr.decode(errors="replace")
+            success = proc.returncode == 0
+            output = stdout_text if success else stderr_text
+            if not success:
+                self.invalidate_backend_cache()
 
             return ExecutionResult(
                 success=success,
                 backend=ExecutionBackend.DROIDRUN_LOCAL,
                 output=output,
-                error=result.stderr if not success else None,
-            )
-        except subprocess.TimeoutExpired:
-            return ExecutionResult(
-                success=False,
-                backend=ExecutionBackend.DROIDRUN_LOCAL,
-                error="Command execution timed out (300s)",
+                error=stderr_text if not success else None,
             )
         except Exception as e:
-            logger.error(f"DroidRun execution failed: {e}")
+            logger.error("DroidRun execution failed: %s", e)
+            self.invalidate_backend_cache()
             return ExecutionResult(
                 success=False,
                 backend=ExecutionBackend.DROIDRUN_LOCAL,
@@ -304,11 +372,11 @@ class ExecutionService:
         Execute with streaming updates (MobileRun only).
 
         Yields status updates as the task progresses.
-        Falls back to non-streaming for DroidRun.
+        For DroidRun, each line the CLI prints is yielded as a "progress" update.
         """
         backend = await self.get_available_backend()
 
-        if backend == ExecutionBackend.MOBILERUN_CLOUD:
+        if backend is ExecutionBackend.MOBILERUN_CLOUD:
             client = self._get_mobilerun_client()
             async for update in client.run_task_stream(
                 device_id=self.mobilerun_device_id,
@@ -319,8 +387,11 @@ class ExecutionService:
                 llm_model=llm_model,
             ):
                 yield update
+        elif backend is ExecutionBackend.DROIDRUN_LOCAL:
+            async for update in self._stream_droidrun(command, max_steps, vision, reasoning):
+                yield update
         else:
-            # For DroidRun, execute and yield single result
+            # No backend - execute reports the error as a single result
             result = await self.execute(command, max_steps, vision, reasoning, llm_model)
             yield {
                 "status": "completed" if result.success else "failed",
@@ -328,28 +399,125 @@ class ExecutionService:
                 "error": result.error,
             }
 
+    async def _stream_droidrun(
+        self,
+        command: str,
+        max_steps: int,
+        vision: bool,
+        reasoning: bool,
+        timeout: float = 300,
+    ) -> AsyncIterator[dict]:
+        """Run the DroidRun CLI, yielding its stdout line by line, then a final status."""
+        cmd = self._droidrun_command(command, max_steps, vision, reasoning)
+        proc = await asyncio.create_subprocess_exec(
+            *cmd,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE,
+        )
+        # Drain stderr concurrently so a chatty stderr cannot fill its pipe and stall stdout
+        stderr_task = asyncio.create_task(proc.stderr.read())
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + timeout
+
+        try:
+            while True:
+                line = await asyncio.wait_for(proc.stdout.readline(), deadline - loop.time())
+                if not line:
+                    break
+                yield {"status": "progress", "output": line.decode(errors="replace").rstrip("\n")}
+
+            stderr = await asyncio.wait_for(stderr_task, deadline - loop.time())
+            await proc.wait()
+        except asyncio.TimeoutError:
+            self.invalidate_backend_cache()
+            yield {
+                "status": "failed",
+                "output": None,
+                "error": f"Command execution timed out ({timeout:g}s)",
+            }
+            return
+        finally:
+            # Also reached when the consumer stops iterating early
+            if proc.returncode is None:
+                proc.kill()
+                await proc.wait()
+            stderr_task.cancel()
+
+        success = proc.returncode == 0
+        if not success:
+            self.invalidate_backend_cache()
+        yield {
+            "status": "completed" if success else "failed",
+            "output": None,
+            "error": None if success else stderr.decode(errors="replace"),
+        }
+
+    async def aclose(self) -> None:
+        """Release the pooled MobileRun connections and the persistent adb shell."""
+        if self._mobilerun_client is not None:
+            await self._mobilerun_client.aclose()
+        if self._adb_shell is not None and self._adb_shell.returncode is None:
+            self._adb_shell.kill()
+            await self._adb_shell.wait()
+        self._adb_shell = None
+
     async def take_screenshot(self) -> Optional[str]:
-        """Take a screenshot from the current device."""
+        """
+        Take a screenshot from the current device.
+
+        Returns a MobileRun URL/base64 string, or base64 PNG for a local device.
+        """
         backend = await self.get_available_backend()
 
-        if backend == ExecutionBackend.MOBILERUN_CLOUD:
+        if backend is ExecutionBackend.MOBILERUN_CLOUD:
             client = self._get_mobilerun_client()
             return await client.take_screenshot(self.mobilerun_device_id)
-        elif backend == ExecutionBackend.DROIDRUN_LOCAL:
-            # Use ADB to take screenshot
+        elif backend is ExecutionBackend.DROIDRUN_LOCAL:
+            screenshot = await self._capture_local_screen()
+            if screenshot:
+                import base64
+                return base64.b64encode(screenshot).decode("ascii")
+        return None
+
+    async def _get_adb_shell(self) -> asyncio.subprocess.Process:
+        """Get the persistent `adb shell`, (re)starting it if needed."""
+        if self._adb_shell is None or self._adb_shell.returncode is not None:
+            cmd = ["adb"]
+            if self.local_device_serial:
+                cmd.extend(["-s", self.local_device_serial])
+            cmd.extend(["shell", "-T"])  # no pty, so binary output is not mangled
+            self._adb_shell = await asyncio.create_subprocess_exec(
+                *cmd,
+                stdin=asyncio.subprocess.PIPE,
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.DEVNULL,
+            )
+        return self._adb_shell
+
+    async def _capture_local_screen(self) -> Optional[bytes]:
+        """
+        Capture a PNG over the persistent `adb shell`.
+
+        Reusing one shell avoids paying adb's connection handshake per screenshot.
+        """
+        async with self._adb_shell_lock:
             try:
-                result = await asyncio.to_thread(
-                    subprocess.run,
-                    ["adb", "shell", "screencap", "-p"],
-                    capture_output=True,
-                    timeout=30,
-                )
-                if result.returncode == 0:
-                    import base64
-                    return base64.b64encode(result.stdout).decode()
+                proc = await self._get_adb_shell()
+                proc.stdin.write(_SCREENCAP_COMMAND)
+                await proc.stdin.drain()
+
+                size = int(await asyncio.wait_for(proc.stdout.readline(), timeout=30))
+                if size < 0:
+                    logger.error("Screenshot failed: screencap error on device")
+                    return None
+                return await asyncio.wait_for(proc.stdout.readexactly(size), timeout=30)
             except Exception as e:
-                logger.error(f"Screenshot failed: {e}")
-        return None
+                # The shell died or the stream is out of sync - start fresh next time
+                logger.error("Screenshot failed: %s", e)
+                if self._adb_shell is not None and self._adb_shell.returncode is None:
+                    self._adb_shell.kill()
+                self._adb_shell = None
+                return None
 
 
 # Singleton instance
@@ -367,15 +535,23 @@ def get_execution_service() -> ExecutionService:
             mobilerun_device_id=os.getenv("MOBILERUN_DEVICE_ID"),
             local_device_serial=os.getenv("DEVICE_SERIAL"),
             prefer_local=os.getenv("PREFER_LOCAL_DEVICE", "false").lower() == "true",
+            probe_timeout=float(os.getenv("EXECUTION_PROBE_TIMEOUT", "2.0")),
         )
     return _service_instance
 
 
+async def shutdown_execution_service() -> None:
+    """Close the singleton execution service, if one was created."""
+    if _service_instance is not None:
+        await _service_instance.aclose()
+
+
 def configure_execution_service(
     mobilerun_api_key: Optional[str] = None,
     mobilerun_device_id: Optional[str] = None,
     local_device_serial: Optional[str] = None,
     prefer_local: bool = False,
+    probe_timeout: float = 2.0,
 ) -> ExecutionService:
     """Configure and return the execution service."""
     global _service_instance
@@ -384,5 +560,6 @@ def configure_execution_service(
         mobilerun_device_id=mobilerun_device_id,
         local_device_serial=local_device_serial,
         prefer_local=prefer_local,
+        probe_timeout=probe_timeout,
     )
     return _service_instance
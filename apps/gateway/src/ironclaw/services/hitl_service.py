@@ -12,20 +12,26 @@ The flow:
 2. HITL service stores request and notifies user (via Telegram/webhook)
 3. User resolves issue and responds
 4. Agent receives response and continues
+
+Concurrency: storing a request and cancelling one are single writes. The
+transitions out of "pending" (pending -> resolved in respond_hitl,
+pending -> expired on timeout) go through the store's atomic transition(),
+so a request is never both answered and expired, even across processes
+sharing a Redis store.
+
+A background sweeper expires requests whose waiter went away (e.g. the
+calling task was cancelled), so they do not linger as "pending".
 """
 import asyncio
-import base64
 import logging
-import uuid
+import os
+import secrets
 from datetime import datetime, timedelta
 from typing import Awaitable, Callable, Optional
 
-logger = logging.getLogger("ironclaw.services.hitl")
+from .hitl_store import HITLStore, InMemoryHITLStore, RedisHITLStore
 
-# In-memory storage (use Redis in production)
-_hitl_requests: dict[str, dict] = {}
-_hitl_responses: dict[str, dict] = {}
-_notification_callbacks: list[Callable[[dict], Awaitable[None]]] = []
+logger = logging.getLogger("ironclaw.services.hitl")
 
 
 class HITLTimeoutError(Exception):
@@ -56,9 +62,24 @@ class HITLService:
     """
 
     DEFAULT_TIMEOUT = 300  # 5 minutes
+    CALLBACK_TIMEOUT = 5.0  # seconds allowed per notification callback
+    SWEEP_INTERVAL = 30.0  # seconds between expiry sweeps
+    RESPONSE_GRACE = 1.0  # seconds to wait for a response that won the race with a timeout
+
+    def __init__(self, store: Optional[HITLStore] = None):
+        """
+        Initialize HITL service.
 
-    def __init__(self):
-        self._lock = asyncio.Lock()
+        Args:
+            store: Request storage (default: in-memory, single process)
+        """
+        self._store = store or InMemoryHITLStore()
+        self._callbacks: list[Callable[[dict], Awaitable[None]]] = []
+        # request_id -> loop.time() deadline, for requests created by this process
+        self._deadlines: dict[str, float] = {}
+        self._sweep_task: Optional[asyncio.Task] = None
+        # Strong refs to in-flight notification tasks so they are not GC'd mid-send
+        self._pending_notifications: set[asyncio.Task] = set()
 
     def register_callback(
         self, callback: Callable[[dict], Awaitable[None]]
@@ -67,8 +88,8 @@ class HITLService:
         Register a callback for HITL notifications.
         The callback receives the HITL request dict.
         """
-        _notification_callbacks.append(callback)
-        logger.info(f"Registered HITL callback: {callback.__name__}")
+        self._callbacks.append(callback)
+        logger.info("Registered HITL callback: %s", callback.__name__)
 
     async def request_hitl(
         self,
@@ -96,66 +117,96 @@ class HITLService:
         Raises:
             HITLTimeoutError: If no response within timeout
         """
-        request_id = f"hitl-{uuid.uuid4().hex[:8]}"
-
-        # Encode screenshot if provided
-        screenshot_b64 = None
-        if screenshot:
-            screenshot_b64 = base64.b64encode(screenshot).decode("utf-8")
+        request_id = f"hitl-{secrets.token_hex(4)}"
+        now = datetime.now()
 
         request = {
             "request_id": request_id,
             "task_id": task_id,
             "hitl_type": hitl_type,
             "message": message,
-            "screenshot_base64": screenshot_b64,
+            # Raw bytes; base64 only happens when a screenshot crosses a JSON boundary
+            "screenshot_bytes": screenshot or None,
             "options": options or ["Retry", "Abort", "I solved it"],
-            "created_at": datetime.now().isoformat(),
-            "expires_at": (datetime.now() + timedelta(seconds=timeout_seconds)).isoformat(),
+            "created_at": now.isoformat(),
+            "expires_at": (now + timedelta(seconds=timeout_seconds)).isoformat(),
             "status": "pending",
         }
 
-        async with self._lock:
-            _hitl_requests[request_id] = request
+        await self._store.add_request(request)
+        self._deadlines[request_id] = asyncio.get_running_loop().time() + timeout_seconds
+        self._ensure_sweeper()
 
-        logger.info(f"HITL request created: {request_id} ({hitl_type})")
+        logger.info("HITL request created: %s (%s)", request_id, hitl_type)
 
-        # Notify all registered callbacks
-        for callback in _notification_callbacks:
-            try:
-                await callback(request)
-            except Exception as e:
-                logger.error(f"HITL callback failed: {e}")
+        # Notify callbacks in the background; the agent starts waiting right away
+        for callback in tuple(self._callbacks):  # snapshot: callbacks may register more
+            task = asyncio.create_task(self._safe_call(callback, request))
+            self._pending_notifications.add(task)
+            task.add_done_callback(self._pending_notifications.discard)
 
         # Wait for response
         response = await self._wait_for_response(request_id, timeout_seconds)
         return response
 
+    async def _safe_call(
+        self, callback: Callable[[dict], Awaitable[None]], request: dict
+    ) -> None:
+        """Run one notification callback with a timeout, logging any failure."""
+        try:
+            await asyncio.wait_for(callback(request), self.CALLBACK_TIMEOUT)
+        except Exception as e:
+            logger.error("HITL callback %s failed: %r", callback.__name__, e)
+
     async def _wait_for_response(
         self, request_id: str, timeout_seconds: int
     ) -> dict:
         """Wait for a response to a HITL request."""
-        deadline = datetime.now() + timedelta(seconds=timeout_seconds)
-        poll_interval = 1.0  # seconds
-
-        while datetime.now() < deadline:
-            # Check if response exists
-            if request_id in _hitl_responses:
-                response = _hitl_responses.pop(request_id)
-                async with self._lock:
-                    if request_id in _hitl_requests:
-                        _hitl_requests[request_id]["status"] = "resolved"
-                logger.info(f"HITL response received: {request_id} -> {response['action']}")
-                return response
-
-            await asyncio.sleep(poll_interval)
-
-        # Timeout - mark as expired
-        async with self._lock:
-            if request_id in _hitl_requests:
-                _hitl_requests[request_id]["status"] = "expired"
+        response = await self._store.wait_response(request_id, timeout_seconds)
+        if response is None:
+            # Timeout - mark as expired, unless a response claimed the request first
+            if not await self._expire(request_id):
+                response = await self._store.wait_response(request_id, self.RESPONSE_GRACE)
+            if response is None:
+                raise HITLTimeoutError(f"HITL request {request_id} timed out after {timeout_seconds}s")
+
+        logger.info("HITL response received: %s -> %s", request_id, response["action"])
+        return response
 
-        raise HITLTimeoutError(f"HITL request {request_id} timed out after {timeout_seconds}s")
+    async def _expire(self, request_id: str) -> bool:
+        """Mark a request as expired if it is still pending. Returns whether it was."""
+        self._deadlines.pop(request_id, None)
+        return await self._store.transition(request_id, "pending", "expired")
+
+    def _ensure_sweeper(self) -> None:
+        """Start the expiry sweeper on first use."""
+        if self._sweep_task is None or self._sweep_task.done():
+            self._sweep_task = asyncio.create_task(self._sweep_loop())
+
+    async def _sweep_loop(self) -> None:
+        """Periodically expire requests past their deadline."""
+        loop = asyncio.get_running_loop()
+        while True:
+            await asyncio.sleep(self.SWEEP_INTERVAL)
+            now = loop.time()
+            expired = [rid for rid, deadline in self._deadlines.items() if deadline <= now]
+            for request_id in expired:
+                try:
+                    await self._expire(request_id)
+                except Exception as e:
+                    logger.error("Failed to expire HITL request %s: %s", request_id, e)
+
+    async def aclose(self) -> None:
+        """Stop the expiry sweeper and let in-flight notifications finish."""
+        if self._pending_notifications:
+            await asyncio.gather(*self._pending_notifications, return_exceptions=True)
+        if self._sweep_task is not None:
+            self._sweep_task.cancel()
+            try:
+                await self._sweep_task
+            except asyncio.CancelledError:
+                pass
+            self._sweep_task = None
 
     async def respond_hitl(
         self,
@@ -174,13 +225,12 @@ class HITLService:
         Returns:
             True if response was recorded, False if request not found
         """
-        if request_id not in _hitl_requests:
-            logger.warning(f"HITL response for unknown request: {request_id}")
-            return False
-
-        request = _hitl_requests[request_id]
-        if request["status"] != "pending":
-            logger.warning(f"HITL request already resolved: {request_id}")
+        if not await self._store.transition(request_id, "pending", "resolved"):
+            request = await self._store.get_request(request_id)
+            if request is None:
+                logger.warning("HITL response for unknown request: %s", request_id)
+            else:
+                logger.warning("HITL request already %s: %s", request["status"], request_id)
             return False
 
         response = {
@@ -190,38 +240,32 @@ class HITLService:
             "resolved_at": datetime.now().isoformat(),
         }
 
-        _hitl_responses[request_id] = response
-        logger.info(f"HITL response recorded: {request_id} -> {action}")
+        await self._store.set_response(request_id, response)
+        logger.info("HITL response recorded: %s -> %s", request_id, action)
         return True
 
     async def get_pending_requests(self, task_id: Optional[str] = None) -> list[dict]:
         """Get all pending HITL requests, optionally filtered by task_id."""
-        pending = []
-        for req in _hitl_requests.values():
-            if req["status"] == "pending":
-                if task_id is None or req["task_id"] == task_id:
-                    pending.append(req)
-        return pending
+        return await self._store.list_pending(task_id)
 
     async def get_request(self, request_id: str) -> Optional[dict]:
         """Get a specific HITL request."""
-        return _hitl_requests.get(request_id)
+        return await self._store.get_request(request_id)
 
     async def cancel_request(self, request_id: str) -> bool:
         """Cancel a pending HITL request."""
-        if request_id not in _hitl_requests:
+        if await self._store.get_request(request_id) is None:
             return False
-
-        async with self._lock:
-            _hitl_requests[request_id]["status"] = "cancelled"
+        await self._store.set_status(request_id, "cancelled")
 
         # Trigger response with "Abort" action
-        _hitl_responses[request_id] = {
+        response = {
             "request_id": request_id,
             "action": "Abort",
             "custom_input": "Cancelled by user",
             "resolved_at": datetime.now().isoformat(),
         }
+        await self._store.set_response(request_id, response)
         return True
 
 
@@ -233,5 +277,16 @@ def get_hitl_service() -> HITLService:
     """Get the singleton HITL service instance."""
     global _service_instance
     if _service_instance is None:
-        _service_instance = HITLService()
+        # HITL_BACKEND=redis shares requests across gateway processes
+        if os.getenv("HITL_BACKEND", "memory").lower() == "redis":
+            store = RedisHITLStore(os.getenv("REDIS_URL", "redis://localhost:6379/0"))
+        else:
+            store = InMemoryHITLStore()
+        _service_instance = HITLService(store=store)
     return _service_instance
+
+
+async def shutdown_hitl_service() -> None:
+    """Stop the singleton HITL service's background work, if one was created."""
+    if _service_instance is not None:
+        await _service_instance.aclose()
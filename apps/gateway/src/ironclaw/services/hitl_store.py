@@ -0,0 +1,265 @@
+"""
+Storage backends for HITL (Human-in-the-Loop) requests.
+
+- InMemoryHITLStore: default, single gateway process
+- RedisHITLStore: shared across gateway processes; responses are delivered
+  to waiters on any node via Redis pub/sub
+"""
+import asyncio
+import json
+import logging
+import time
+from typing import Optional, Protocol
+
+logger = logging.getLogger("ironclaw.services.hitl_store")
+
+
+class HITLStore(Protocol):
+    """Storage for HITL requests and delivery of their responses."""
+
+    async def add_request(self, request: dict) -> None:
+        """Store a new request. Must be called before its response can be awaited."""
+        ...
+
+    async def get_request(self, request_id: str) -> Optional[dict]:
+        """Get a request by ID."""
+        ...
+
+    async def set_status(self, request_id: str, status: str) -> None:
+        """Update the status of a request."""
+        ...
+
+    async def transition(self, request_id: str, from_status: str, to_status: str) -> bool:
+        """
+        Atomically move a request from from_status to to_status.
+
+        Returns False, changing nothing, if the request is missing or not in from_status.
+        """
+        ...
+
+    async def list_pending(self, task_id: Optional[str] = None) -> list[dict]:
+        """List pending requests, optionally filtered by task_id."""
+        ...
+
+    async def set_response(self, request_id: str, response: dict) -> None:
+        """Record a response and wake whoever is waiting on it."""
+        ...
+
+    async def wait_response(self, request_id: str, timeout: float) -> Optional[dict]:
+        """Wait for a response. Returns None on timeout."""
+        ...
+
+
+class InMemoryHITLStore:
+    """HITL store backed by process-local dicts and futures."""
+
+    def __init__(self):
+        self._requests: dict[str, dict] = {}
+        # request_id -> future resolved with the response dict
+        self._waiters: dict[str, asyncio.Future] = {}
+        # Pending request IDs, overall and by task (dicts as insertion-ordered sets)
+        self._pending_ids: dict[str, None] = {}
+        self._pending_by_task: dict[str, dict[str, None]] = {}
+
+    async def add_request(self, request: dict) -> None:
+        request_id = request["request_id"]
+        # Register the waiter before the request is visible, so no response can be missed
+        self._waiters[request_id] = asyncio.get_running_loop().create_future()
+        self._requests[request_id] = request
+        if request["status"] == "pending":
+            self._pending_ids[request_id] = None
+            self._pending_by_task.setdefault(request["task_id"], {})[request_id] = None
+
+    async def get_request(self, request_id: str) -> Optional[dict]:
+        return self._requests.get(request_id)
+
+    async def set_status(self, request_id: str, status: str) -> None:
+        request = self._requests.get(request_id)
+        if request is None:
+            return
+        request["status"] = status
+        if status != "pending":
+            self._pending_ids.pop(request_id, None)
+            task_pending = self._pending_by_task.get(request["task_id"])
+            if task_pending is not None:
+                task_pending.pop(request_id, None)
+                if not task_pending:
+                    del self._pending_by_task[request["task_id"]]
+
+    async def transition(self, request_id: str, from_status: str, to_status: str) -> bool:
+        # No await between the check and the set, so this is atomic within the loop
+        request = self._requests.get(request_id)
+        if request is None or request["status"] != from_status:
+            return False
+        await self.set_status(request_id, to_status)
+        return True
+
+    async def list_pending(self, task_id: Optional[str] = None) -> list[dict]:
+        if task_id is None:
+            request_ids = self._pending_ids
+        else:
+            request_ids = self._pending_by_task.get(task_id, {})
+        return [self._requests[rid] for rid in request_ids]
+
+    async def set_response(self, request_id: str, response: dict) -> None:
+        waiter = self._waiters.get(request_id)
+        if waiter is not None and not waiter.done():
+            waiter.set_result(response)
+
+    async def wait_response(self, request_id: str, timeout: float) -> Optional[dict]:
+        waiter = self._waiters.get(request_id)
+        if waiter is None:
+            return None
+        try:
+            # asyncio.wait, unlike wait_for, leaves the future alone on timeout, so
+            # a response set right at the deadline is still returned here
+            await asyncio.wait((waiter,), timeout=timeout)
+            return waiter.result() if waiter.done() else None
+        finally:
+            self._waiters.pop(request_id, None)
+
+
+class RedisHITLStore:
+    """
+    HITL store backed by Redis, for running several gateway processes.
+
+    Keys:
+        hitl:req:<id>   request JSON (without screenshot)
+        hitl:shot:<id>  raw screenshot bytes
+        hitl:resp:<id>  response JSON; also published on the channel of the same name
+        hitl:pending    sorted set of pending request IDs, scored by when their keys expire
+        hitl:pending:task:<task_id>  the same, for one task
+
+    Status changes are read-modify-write under WATCH/MULTI, so two processes
+    cannot both move a request out of "pending". IDs whose request key has
+    expired are pruned from the pending sets when they are listed.
+    """
+
+    KEY_TTL = 24 * 60 * 60  # seconds to keep requests and responses
+
+    def __init__(self, url: str = "redis://localhost:6379/0", client=None):
+        """
+        Args:
+            url: Redis URL
+            client: An existing redis.asyncio client to use instead of connecting to url
+        """
+        if client is None:
+            try:
+                import redis.asyncio as redis
+            except ImportError as e:
+                raise RuntimeError("RedisHITLStore requires the 'redis' package") from e
+            client = redis.from_url(url)
+        self._redis = client
+
+    async def add_request(self, request: dict) -> None:
+        request_id = request["request_id"]
+        data = {k: v for k, v in request.items() if k != "screenshot_bytes"}
+        task_key = f"hitl:pending:task:{request['task_id']}"
+        async with self._redis.pipeline(transaction=True) as pipe:
+            pipe.set(f"hitl:req:{request_id}", json.dumps(data), ex=self.KEY_TTL)
+            if request.get("screenshot_bytes"):
+                pipe.set(f"hitl:shot:{request_id}", request["screenshot_bytes"], ex=self.KEY_TTL)
+            if request["status"] == "pending":
+                expires = time.time() + self.KEY_TTL
+                pipe.zadd("hitl:pending", {request_id: expires})
+                pipe.zadd(task_key, {request_id: expires})
+                pipe.expire(task_key, self.KEY_TTL)
+            await pipe.execute()
+
+    async def get_request(self, request_id: str) -> Optional[dict]:
+        raw, screenshot = await self._redis.mget(
+            f"hitl:req:{request_id}", f"hitl:shot:{request_id}"
+        )
+        if raw is None:
+            return None
+        request = json.loads(raw)
+        request["screenshot_bytes"] = screenshot
+        return request
+
+    async def set_status(self, request_id: str, status: str) -> None:
+        await self._update_status(request_id, status)
+
+    async def transition(self, request_id: str, from_status: str, to_status: str) -> bool:
+        return await self._update_status(request_id, to_status, expected=from_status)
+
+    async def _update_status(
+        self, request_id: str, status: str, expected: Optional[str] = None
+    ) -> bool:
+        """Set a request's status (only if it is `expected`, when given), retrying on conflict."""
+        from redis.exceptions import WatchError
+
+        key = f"hitl:req:{request_id}"
+        async with self._redis.pipeline(transaction=True) as pipe:
+            while True:
+                try:
+                    await pipe.watch(key)
+                    raw = await pipe.get(key)
+                    if raw is None:
+                        return False
+                    data = json.loads(raw)
+                    if expected is not None and data["status"] != expected:
+                        return False
+                    data["status"] = status
+                    pipe.multi()
+                    pipe.set(key, json.dumps(data), keepttl=True)
+                    if status != "pending":
+                        pipe.zrem("hitl:pending", request_id)
+                        pipe.zrem(f"hitl:pending:task:{data['task_id']}", request_id)
+                    await pipe.execute()
+                    return True
+                except WatchError:
+                    # Another process changed the request; re-read and try again
+                    continue
+
+    async def list_pending(self, task_id: Optional[str] = None) -> list[dict]:
+        key = "hitl:pending" if task_id is None else f"hitl:pending:task:{task_id}"
+        await self._redis.zremrangebyscore(key, "-inf", time.time())
+        request_ids = [rid.decode() for rid in await self._redis.zrange(key, 0, -1)]
+        if not request_ids:
+            return []
+        raws = await self._redis.mget([f"hitl:req:{rid}" for rid in request_ids])
+        screenshots = await self._redis.mget([f"hitl:shot:{rid}" for rid in request_ids])
+
+        pending = []
+        missing = []
+        for request_id, raw, screenshot in zip(request_ids, raws, screenshots):
+            if raw is None:
+                missing.append(request_id)
+                continue
+            req = json.loads(raw)
+            if req["status"] == "pending" and (task_id is None or req["task_id"] == task_id):
+                req["screenshot_bytes"] = screenshot
+                pending.append(req)
+        if missing:
+            await self._redis.zrem(key, *missing)
+        return pending
+
+    async def set_response(self, request_id: str, response: dict) -> None:
+        payload = json.dumps(response)
+        async with self._redis.pipeline(transaction=True) as pipe:
+            pipe.set(f"hitl:resp:{request_id}", payload, ex=self.KEY_TTL)
+            pipe.publish(f"hitl:resp:{request_id}", payload)
+            await pipe.execute()
+
+    async def wait_response(self, request_id: str, timeout: float) -> Optional[dict]:
+        channel = f"hitl:resp:{request_id}"
+        pubsub = self._redis.pubsub()
+        await pubsub.subscribe(channel)
+        try:
+            # Subscribed first, so a response published from now on cannot be missed
+            raw = await self._redis.get(channel)
+            if raw is not None:
+                return json.loads(raw)
+
+            loop = asyncio.get_running_loop()
+            deadline = loop.time() + timeout
+            while (remaining := deadline - loop.time()) > 0:
+                message = await pubsub.get_message(
+                    ignore_subscribe_messages=True, timeout=remaining
+                )
+                if message is not None:
+                    return json.loads(message["data"])
+            return None
+        finally:
+            await pubsub.unsubscribe(channel)
+            await pubsub.aclose()
@@ -11,22 +11,39 @@ The flow:
 4. Async response with runId returned immediately
 5. Task is processed and results can be queried via status endpoint
 6. Telegram notification sent for visibility
+
+Task state is only touched from the event loop, and no mutation awaits
+part-way through, so status updates, inserts and evictions are atomic
+without locks.
 """
 
 import asyncio
-import json
+import hmac
+import itertools
 import logging
 import os
+import time
 import uuid
 from datetime import datetime, timezone
 from enum import Enum
 from typing import Any, Callable, Awaitable, Optional
 
 import httpx
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, field_serializer
 
 logger = logging.getLogger("ironclaw.services.openclaw")
 
+try:
+    import orjson
+
+    def _json_dumps(obj) -> bytes:
+        return orjson.dumps(obj, default=str)
+except ImportError:
+    import json
+
+    def _json_dumps(obj) -> bytes:
+        return json.dumps(obj, default=str).encode("utf-8")
+
 
 class TaskStatus(str, Enum):
     """Status of an OpenClaw task."""
@@ -38,6 +55,12 @@ class TaskStatus(str, Enum):
     CANCELLED = "cancelled"
 
 
+class TokenError(str, Enum):
+    """Why an Authorization header was rejected."""
+    MISSING = "missing"  # no header, or not a Bearer credential
+    INVALID = "invalid"  # a Bearer token that does not match
+
+
 class StepType(str, Enum):
     """Types of steps that can be executed."""
     HTTP_ACTION = "http_action"
@@ -76,7 +99,7 @@ class WebhookPayload(BaseModel):
     params: StepParams = Field(default_factory=StepParams)
 
     class Config:
-        extra = "allow"
+        extra = "ignore"  # unknown fields are never read downstream
 
 
 class WebhookRequest(BaseModel):
@@ -87,7 +110,7 @@ class WebhookRequest(BaseModel):
     payload: WebhookPayload
 
     class Config:
-        extra = "allow"
+        extra = "ignore"  # unknown fields are never read downstream
 
 
 class TaskInfo(BaseModel):
@@ -95,12 +118,16 @@ class TaskInfo(BaseModel):
     run_id: str
     task_id: str
     status: TaskStatus
-    created_at: str
-    updated_at: str
+    created_at: float  # epoch seconds; serialized as ISO 8601 UTC
+    updated_at: float
     step_type: str
     result: Optional[dict] = None
     error: Optional[str] = None
 
+    @field_serializer("created_at", "updated_at")
+    def _serialize_timestamp(self, value: float) -> str:
+        return datetime.fromtimestamp(value, tz=timezone.utc).isoformat()
+
 
 class WebhookResponse(BaseModel):
     """Response for webhook request."""
@@ -111,34 +138,168 @@ class WebhookResponse(BaseModel):
     error: Optional[str] = None
 
 
-# In-memory storage (use Redis/PostgreSQL in production)
-_task_queue: dict[str, TaskInfo] = {}
-_task_processors: list[Callable[[TaskInfo, WebhookRequest], Awaitable[dict]]] = []
+# Step types share a processing lane; a slow lane cannot starve the others
+_LANE_BY_STEP_TYPE = {
+    StepType.HTTP_ACTION.value: "io",
+    StepType.EXTRACT.value: "io",
+    StepType.SCRIPT.value: "io",
+    StepType.CLICK.value: "mobile",
+    StepType.MOBILE_ACTION.value: "mobile",
+    StepType.LOG.value: "notify",
+}
+
+# Telegram notification per default-processed step type
+_TELEGRAM_TEMPLATES = {
+    "log": (
+        "🎣 *OpenClaw Webhook Received*\n\n"
+        "*Task ID:* `{task_id}`\n"
+        "*Type:* `{step_type}`\n\n"
+        "📝 *Message:*\n{message}"
+    ),
+    "http_action": (
+        "🌐 *HTTP Action Requested*\n\n"
+        "*Task ID:* `{task_id}`\n"
+        "*Method:* `{method}`\n"
+        "*URL:* {url}"
+    ),
+    "mobile_action": (
+        "📱 *Mobile Action Requested*\n\n"
+        "*Task ID:* `{task_id}`\n"
+        "*Action:* `{action}`\n"
+        "*Selector:* `{selector}`"
+    ),
+    "extract": (
+        "🔍 *Data Extraction Requested*\n\n"
+        "*Task ID:* `{task_id}`\n"
+        "*Selector:* `{selector}`"
+    ),
+    "unhandled": (
+        "⚠️ *Unhandled Webhook Step*\n\n"
+        "*Task ID:* `{task_id}`\n"
+        "*Step Type:* `{step_type}`\n"
+        "*Params:* `{params}`"
+    ),
+}
+
+_TERMINAL_STATUSES = frozenset({TaskStatus.COMPLETED, TaskStatus.FAILED, TaskStatus.CANCELLED})
 
 
 class TelegramNotifier:
-    """Helper class to send Telegram notifications."""
-    
+    """
+    Helper class to send Telegram notifications.
+
+    enqueue() coalesces notifications that arrive within COALESCE_WINDOW into a
+    single message and keeps sends at least MIN_SEND_INTERVAL apart, which is
+    Telegram's per-chat rate limit.
+    """
+
+    COALESCE_WINDOW = 0.25  # seconds to collect notifications into one message
+    MIN_SEND_INTERVAL = 1.0  # seconds between messages to the same chat
+    MAX_MESSAGE_LENGTH = 4096  # Telegram's limit for one message
+    SEPARATOR = "\n\n---\n\n"
+
     def __init__(self):
         self.bot_token = os.getenv("TELEGRAM_BOT_TOKEN")
         self.chat_id = os.getenv("TELEGRAM_CHAT_ID")
+        # One pooled keep-alive client for every notification. A full pool waits
+        # at most TELEGRAM_POOL_TIMEOUT for a free connection instead of stalling.
         self._client: Optional[httpx.AsyncClient] = None
-    
-    async def _get_client(self) -> httpx.AsyncClient:
-        if self._client is None or self._client.is_closed:
-            self._client = httpx.AsyncClient(timeout=10.0)
-        return self._client
-    
+        if self.bot_token:
+            pool_size = int(os.getenv("TELEGRAM_POOL_SIZE", "32"))
+            pool_timeout = float(os.getenv("TELEGRAM_POOL_TIMEOUT", "5.0"))
+            self._client = httpx.AsyncClient(
+                base_url=f"https://api.telegram.org/bot{self.bot_token}",
+                limits=httpx.Limits(
+                    max_keepalive_connections=pool_size, max_connections=pool_size
+                ),
+                timeout=httpx.Timeout(10.0, pool=pool_timeout),
+            )
+        self.enabled = bool(self._client is not None and self.chat_id)
+        if not self.enabled:
+            logger.warning(
+                "Telegram not configured (TELEGRAM_BOT_TOKEN or TELEGRAM_CHAT_ID missing); "
+                "notifications are disabled"
+            )
+        self._pending: asyncio.Queue[str] = asyncio.Queue()
+        # Messages taken off the queue but not yet sent; survives flusher cancellation
+        self._outbox: list[str] = []
+        self._flusher: Optional[asyncio.Task] = None
+        # The send of _outbox[0] in progress; shielded so cancelling the flusher never
+        # cuts a message off halfway (which would resend it on close)
+        self._in_flight: Optional[asyncio.Task] = None
+
+    async def aclose(self) -> None:
+        """Send any queued notifications and close the pooled HTTP client."""
+        if self._flusher is not None:
+            self._flusher.cancel()
+            try:
+                await self._flusher
+            except asyncio.CancelledError:
+                pass
+            self._flusher = None
+        if self._in_flight is not None:
+            # Let the message being sent finish; it removes itself from the outbox
+            await self._in_flight
+            self._in_flight = None
+        while not self._pending.empty():
+            self._outbox.append(self._pending.get_nowait())
+        for text in self._pack(self._outbox):
+            await self.send_message(text)
+        self._outbox.clear()
+        if self._client is not None:
+            await self._client.aclose()
+
+    def enqueue(self, text: str) -> bool:
+        """
+        Queue a message to be sent with any others arriving in the same window.
+
+        Returns True once the message is queued, not sent; delivery happens in
+        the background and failures are only logged. Returns False if Telegram
+        is not configured.
+        """
+        if not self.enabled:
+            return False
+        self._pending.put_nowait(text)
+        if self._flusher is None or self._flusher.done():
+            self._flusher = asyncio.create_task(self._flush_loop())
+        return True
+
+    async def _flush_loop(self) -> None:
+        """Drain the queue in coalesced batches, rate limited per chat."""
+        while True:
+            self._outbox.append(await self._pending.get())
+            await asyncio.sleep(self.COALESCE_WINDOW)
+            while not self._pending.empty():
+                self._outbox.append(self._pending.get_nowait())
+            self._outbox[:] = self._pack(self._outbox)
+            while self._outbox:
+                self._in_flight = asyncio.create_task(self._send_head())
+                await asyncio.shield(self._in_flight)
+                self._in_flight = None
+                await asyncio.sleep(self.MIN_SEND_INTERVAL)
+
+    async def _send_head(self) -> None:
+        """Send the first outbox message and drop it from the outbox."""
+        await self.send_message(self._outbox[0])
+        del self._outbox[0]
+
+    def _pack(self, texts: list[str]) -> list[str]:
+        """Join texts into as few messages as fit MAX_MESSAGE_LENGTH."""
+        messages: list[str] = []
+        for text in texts:
+            if messages and len(messages[-1]) + len(self.SEPARATOR) + len(text) <= self.MAX_MESSAGE_LENGTH:
+                messages[-1] += self.SEPARATOR + text
+            else:
+                messages.append(text)
+        return messages
+
     async def send_message(self, text: str, parse_mode: str = "Markdown") -> bool:
         """Send a message to Telegram."""
-        if not self.bot_token or not self.chat_id:
-            logger.warning("Telegram not configured (TELEGRAM_BOT_TOKEN or TELEGRAM_CHAT_ID missing)")
+        if not self.enabled:
             return False
         
         try:
-            client = await self._get_client()
-            url = f"https://api.telegram.org/bot{self.bot_token}/sendMessage"
-            response = await client.post(url, json={
+            response = await self._client.post("/sendMessage", json={
                 "chat_id": self.chat_id,
                 "text": text,
                 "parse_mode": parse_mode,
@@ -148,10 +309,10 @@ class TelegramNotifier:
                 logger.info("Telegram notification sent successfully")
                 return True
             else:
-                logger.error(f"Telegram API error: {response.status_code} - {response.text}")
+                logger.error("Telegram API error: %s - %s", response.status_code, response.text)
                 return False
         except Exception as e:
-            logger.exception(f"Failed to send Telegram message: {e}")
+            logger.exception("Failed to send Telegram message: %s", e)
             return False
 
 
@@ -167,6 +328,14 @@ def get_telegram_notifier() -> TelegramNotifier:
     return _telegram_notifier
 
 
+async def shutdown_telegram_notifier() -> None:
+    """Close the Telegram notifier singleton, if one was created."""
+    global _telegram_notifier
+    if _telegram_notifier is not None:
+        await _telegram_notifier.aclose()
+        _telegram_notifier = None
+
+
 class OpenClawService:
     """
     OpenClaw Webhook Service.
@@ -190,6 +359,10 @@ class OpenClawService:
         task = service.get_task_status(run_id)
     """
 
+    TASK_TTL = int(os.getenv("OPENCLAW_TASK_TTL", "3600"))  # seconds to keep finished tasks
+    MAX_TASKS = 10_000  # finished tasks beyond this are evicted oldest-first
+    EVICTION_INTERVAL = 60.0  # seconds between eviction sweeps
+
     def __init__(self, hook_token: str):
         """
         Initialize OpenClaw service.
@@ -198,8 +371,26 @@ class OpenClawService:
             hook_token: Secret token for validating incoming webhooks
         """
         self.hook_token = hook_token
-        self._lock = asyncio.Lock()
+        self._expected_authorization = f"Bearer {hook_token}".encode()
+        # In-memory storage (use Redis/PostgreSQL in production)
+        self._tasks: dict[str, TaskInfo] = {}
+        # OpenClaw taskId -> run_id of the first run enqueued for it
+        self._task_id_index: dict[str, str] = {}
+        # Replaced, never mutated, on register so _run_task can read it without copying
+        self._processors: tuple[Callable[[TaskInfo, WebhookRequest], Awaitable[dict]], ...] = ()
+        self._eviction_task: Optional[asyncio.Task] = None
         self._background_tasks: set[asyncio.Task] = set()
+        # run_id -> background task processing it, so cancel-task can stop it
+        self._runs: dict[str, asyncio.Task] = {}
+        # Backpressure: execute-step is rejected once this many runs are queued or running
+        self._max_backlog = int(os.getenv("OPENCLAW_MAX_BACKLOG", "1000"))
+        # Caps how many queued tasks are processed at once per lane; webhooks
+        # still return immediately
+        self._max_inflight = int(os.getenv("OPENCLAW_MAX_INFLIGHT", "32"))
+        self._lane_semaphores: dict[str, asyncio.Semaphore] = {}
+        # Per-taskId cap so one noisy task cannot fill a lane: taskId -> [semaphore, users]
+        self._max_inflight_per_task = int(os.getenv("OPENCLAW_MAX_INFLIGHT_PER_TASK", "4"))
+        self._task_slots: dict[str, list] = {}
 
     def validate_token(self, authorization: Optional[str]) -> bool:
         """
@@ -211,14 +402,25 @@ class OpenClawService:
         Returns:
             True if valid, False otherwise
         """
-        if not authorization:
-            return False
+        return self.check_token(authorization) is None
 
-        if not authorization.startswith("Bearer "):
-            return False
+    def check_token(self, authorization: Optional[str]) -> Optional[TokenError]:
+        """
+        Check the Authorization header.
+
+        Args:
+            authorization: The Authorization header value
+
+        Returns:
+            None if valid, otherwise why it was rejected
+        """
+        if not authorization or not authorization.startswith("Bearer "):
+            return TokenError.MISSING
 
-        token = authorization.split(" ", 1)[1]
-        return token == self.hook_token
+        # Constant-time compare of the whole header
+        if not hmac.compare_digest(authorization.encode(), self._expected_authorization):
+            return TokenError.INVALID
+        return None
 
     def register_processor(
         self, processor: Callable[[TaskInfo, WebhookRequest], Awaitable[dict]]
@@ -227,10 +429,12 @@ class OpenClawService:
         Register a task processor callback.
 
         The processor receives the TaskInfo and original WebhookRequest,
-        and should return a dict with the result.
+        and should return a dict with the result. When several processors
+        are registered they run concurrently and their results are merged
+        in registration order.
         """
-        _task_processors.append(processor)
-        logger.info(f"Registered OpenClaw processor: {processor.__name__}")
+        self._processors = (*self._processors, processor)
+        logger.info("Registered OpenClaw processor: %s", processor.__name__)
 
     async def handle_webhook(
         self,
@@ -248,11 +452,12 @@ class OpenClawService:
             WebhookResponse with status and runId
         """
         # Validate token
-        if not self.validate_token(authorization):
-            logger.warning(f"Invalid token for task {request.taskId}")
+        token_error = self.check_token(authorization)
+        if token_error is not None:
+            logger.warning("Rejected token (%s) for task %s", token_error.value, request.taskId)
             return WebhookResponse(
                 ok=False,
-                error="Invalid or missing authorization token",
+                error=f"{token_error.value.capitalize()} authorization token",
             )
 
         # Route by request type
@@ -263,7 +468,7 @@ class OpenClawService:
         elif request.type == "cancel-task":
             return await self._handle_cancel_task(request)
         else:
-            logger.warning(f"Unknown request type: {request.type}")
+            logger.warning("Unknown request type: %s", request.type)
             return WebhookResponse(
                 ok=False,
                 error=f"Unknown request type: {request.type}",
@@ -271,8 +476,16 @@ class OpenClawService:
 
     async def _handle_execute_step(self, request: WebhookRequest) -> WebhookResponse:
         """Handle execute-step request."""
+        if len(self._background_tasks) >= self._max_backlog:
+            logger.warning("Rejected task %s: backlog of %d runs is full", request.taskId, self._max_backlog)
+            return WebhookResponse(
+                ok=False,
+                status="rejected",
+                error="Task queue is full, retry later",
+            )
+
         run_id = str(uuid.uuid4())
-        now = datetime.now(timezone.utc).isoformat()
+        now = time.time()
 
         # Create task info
         task_info = TaskInfo(
@@ -285,23 +498,31 @@ class OpenClawService:
         )
 
         # Store in queue
-        async with self._lock:
-            _task_queue[run_id] = task_info
-
-        logger.info(
-            f"Enqueued task {request.taskId} as {run_id}",
-            extra={
-                "run_id": run_id,
-                "task_id": request.taskId,
-                "step_type": request.payload.stepType,
-                "source": request.metadata.source if request.metadata else "unknown",
-            },
-        )
+        self._tasks[run_id] = task_info
+        self._task_id_index.setdefault(request.taskId, run_id)
+        if len(self._tasks) > self.MAX_TASKS:
+            self._evict_over_capacity()
+        self._ensure_eviction_task()
+
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(
+                "Enqueued task %s as %s",
+                request.taskId,
+                run_id,
+                extra={
+                    "run_id": run_id,
+                    "task_id": request.taskId,
+                    "step_type": request.payload.stepType,
+                    "source": request.metadata.source if request.metadata else "unknown",
+                },
+            )
 
         # Start background processing
         task = asyncio.create_task(self._process_task(task_info, request))
         self._background_tasks.add(task)
+        self._runs[run_id] = task
         task.add_done_callback(self._background_tasks.discard)
+        task.add_done_callback(lambda _: self._runs.pop(run_id, None))
 
         return WebhookResponse(
             ok=True,
@@ -316,13 +537,7 @@ class OpenClawService:
         extra = request.payload.params.extra or {}
         task_id_to_find = extra.get("runId") or request.taskId
 
-        # Search for task
-        task_info = None
-        for run_id, info in _task_queue.items():
-            if info.run_id == task_id_to_find or info.task_id == task_id_to_find:
-                task_info = info
-                break
-
+        task_info = self._find_task(task_id_to_find)
         if not task_info:
             return WebhookResponse(
                 ok=False,
@@ -341,70 +556,129 @@ class OpenClawService:
         extra = request.payload.params.extra or {}
         task_id_to_cancel = extra.get("runId") or request.taskId
 
-        # Find and cancel
-        async with self._lock:
-            for run_id, info in _task_queue.items():
-                if info.run_id == task_id_to_cancel or info.task_id == task_id_to_cancel:
-                    if info.status in (TaskStatus.PENDING, TaskStatus.QUEUED, TaskStatus.RUNNING):
-                        info.status = TaskStatus.CANCELLED
-                        info.updated_at = datetime.now(timezone.utc).isoformat()
-                        logger.info(f"Cancelled task {run_id}")
-                        return WebhookResponse(
-                            ok=True,
-                            runId=run_id,
-                            status=TaskStatus.CANCELLED.value,
-                            message="Task cancelled",
-                        )
-                    else:
-                        return WebhookResponse(
-                            ok=False,
-                            runId=run_id,
-                            error=f"Cannot cancel task in status: {info.status.value}",
-                        )
+        info = self._find_task(task_id_to_cancel)
+        if not info:
+            return WebhookResponse(
+                ok=False,
+                error=f"Task not found: {task_id_to_cancel}",
+            )
+
+        if info.status in (TaskStatus.PENDING, TaskStatus.QUEUED, TaskStatus.RUNNING):
+            info.status = TaskStatus.CANCELLED
+            info.updated_at = time.time()
+            # Stop the run whether it is still waiting for a slot or already running
+            run = self._runs.pop(info.run_id, None)
+            if run is not None:
+                run.cancel()
+            logger.info("Cancelled task %s", info.run_id)
+            return WebhookResponse(
+                ok=True,
+                runId=info.run_id,
+                status=TaskStatus.CANCELLED.value,
+                message="Task cancelled",
+            )
 
         return WebhookResponse(
             ok=False,
-            error=f"Task not found: {task_id_to_cancel}",
+            runId=info.run_id,
+            error=f"Cannot cancel task in status: {info.status.value}",
         )
 
+    def _find_task(self, run_or_task_id: str) -> Optional[TaskInfo]:
+        """Look up a task by run_id, falling back to the OpenClaw taskId index."""
+        task_info = self._tasks.get(run_or_task_id)
+        if task_info is None:
+            run_id = self._task_id_index.get(run_or_task_id)
+            if run_id is not None:
+                task_info = self._tasks.get(run_id)
+        return task_info
+
     async def _process_task(self, task_info: TaskInfo, request: WebhookRequest) -> None:
-        """Process a task in the background."""
+        """
+        Process a task in the background.
+
+        At most OPENCLAW_MAX_INFLIGHT_PER_TASK runs of one taskId wait for a lane
+        at a time, so a flood from one taskId cannot queue ahead of everyone
+        else; each lane then runs at most OPENCLAW_MAX_INFLIGHT tasks.
+        """
+        slot = self._task_slots.get(task_info.task_id)
+        if slot is None:
+            slot = self._task_slots[task_info.task_id] = [
+                asyncio.Semaphore(self._max_inflight_per_task), 0
+            ]
+        slot[1] += 1
         try:
-            async with self._lock:
-                task_info.status = TaskStatus.RUNNING
-                task_info.updated_at = datetime.now(timezone.utc).isoformat()
-
-            logger.info(f"Processing task {task_info.run_id}")
-
-            # Execute registered processors
-            result = {}
-            for processor in _task_processors:
-                try:
-                    result = await processor(task_info, request)
-                except Exception as e:
-                    logger.exception(f"Processor {processor.__name__} failed: {e}")
-                    result = {"error": str(e)}
-
-            # If no processors, use default handler
-            if not _task_processors:
-                result = await self._default_processor(task_info, request)
+            async with slot[0]:
+                lane = _LANE_BY_STEP_TYPE.get(task_info.step_type, "default")
+                semaphore = self._lane_semaphores.get(lane)
+                if semaphore is None:
+                    semaphore = self._lane_semaphores[lane] = asyncio.Semaphore(
+                        self._max_inflight
+                    )
+                async with semaphore:
+                    # Cancelled while waiting for a slot
+                    if task_info.status in _TERMINAL_STATUSES:
+                        return
+                    await self._run_task(task_info, request)
+        finally:
+            slot[1] -= 1
+            if not slot[1]:
+                del self._task_slots[task_info.task_id]
+
+    async def _run_task(self, task_info: TaskInfo, request: WebhookRequest) -> None:
+        """Run the processors for a task and record the outcome."""
+        try:
+            task_info.status = TaskStatus.RUNNING
+            task_info.updated_at = time.time()
 
-            async with self._lock:
-                task_info.status = TaskStatus.COMPLETED
-                task_info.result = result
-                task_info.updated_at = datetime.now(timezone.utc).isoformat()
+            logger.info("Processing task %s", task_info.run_id)
 
-            logger.info(
-                f"Completed task {task_info.run_id}",
-                extra={"run_id": task_info.run_id, "result": result},
-            )
+            # Execute registered processors, or the default handler if there are none
+            processors = self._processors
+            if not processors:
+                result = await self._default_processor(task_info, request)
+            elif len(processors) == 1:
+                result = await self._call_processor(processors[0], task_info, request)
+            else:
+                result = {}
+                for partial in await asyncio.gather(
+                    *(self._call_processor(p, task_info, request) for p in processors)
+                ):
+                    result.update(partial)
+
+            if task_info.status == TaskStatus.CANCELLED:
+                return
+            task_info.status = TaskStatus.COMPLETED
+            task_info.result = result
+            task_info.updated_at = time.time()
+
+            if logger.isEnabledFor(logging.INFO):
+                logger.info(
+                    "Completed task %s",
+                    task_info.run_id,
+                    extra={"run_id": task_info.run_id, "result_keys": sorted(result)},
+                )
 
         except Exception as e:
-            logger.exception(f"Failed to process task {task_info.run_id}: {e}")
-            async with self._lock:
-                task_info.status = TaskStatus.FAILED
-                task_info.error = str(e)
-                task_info.updated_at = datetime.now(timezone.utc).isoformat()
+            logger.exception("Failed to process task %s: %s", task_info.run_id, e)
+            if task_info.status == TaskStatus.CANCELLED:
+                return
+            task_info.status = TaskStatus.FAILED
+            task_info.error = str(e)
+            task_info.updated_at = time.time()
+
+    async def _call_processor(
+        self,
+        processor: Callable[[TaskInfo, WebhookRequest], Awaitable[dict]],
+        task_info: TaskInfo,
+        request: WebhookRequest,
+    ) -> dict:
+        """Run one processor, turning a failure into an error result."""
+        try:
+            return await processor(task_info, request)
+        except Exception as e:
+            logger.exception("Processor %s failed: %s", processor.__name__, e)
+            return {"error": str(e)}
 
     async def _default_processor(
         self, task_info: TaskInfo, request: WebhookRequest
@@ -417,109 +691,137 @@ class OpenClawService:
         if step_type == "log":
             # Simple log step - also send to Telegram
             message = params.message or "No message provided"
-            logger.info(f"[OpenClaw Log] {message}")
-            
-            # Send to Telegram
-            telegram_msg = (
-                f"🎣 *OpenClaw Webhook Received*\n\n"
-                f"*Task ID:* `{request.taskId}`\n"
-                f"*Type:* `{step_type}`\n\n"
-                f"📝 *Message:*\n{message}"
-            )
-            await notifier.send_message(telegram_msg)
-            
-            return {"logged": True, "message": message, "telegram_sent": True}
+            logger.info("[OpenClaw Log] %s", message)
+            if notifier.enabled:
+                notifier.enqueue(_TELEGRAM_TEMPLATES["log"].format(
+                    task_id=request.taskId, step_type=step_type, message=message,
+                ))
+            return {"logged": True, "message": message, "telegram_queued": notifier.enabled}
 
         elif step_type == "http_action":
             # HTTP action - could integrate with httpx
-            logger.info(f"HTTP action requested: {params.method} {params.url}")
-            
-            # Notify Telegram
-            telegram_msg = (
-                f"🌐 *HTTP Action Requested*\n\n"
-                f"*Task ID:* `{request.taskId}`\n"
-                f"*Method:* `{params.method}`\n"
-                f"*URL:* {params.url}"
-            )
-            await notifier.send_message(telegram_msg)
-            
+            logger.info("HTTP action requested: %s %s", params.method, params.url)
+            if notifier.enabled:
+                notifier.enqueue(_TELEGRAM_TEMPLATES["http_action"].format(
+                    task_id=request.taskId, method=params.method, url=params.url,
+                ))
             return {
                 "action": "http_action",
                 "url": params.url,
                 "method": params.method,
                 "status": "acknowledged",
-                "telegram_sent": True,
+                "telegram_queued": notifier.enabled,
             }
 
         elif step_type in ("click", "mobile_action"):
             # Mobile action - delegate to execution service
-            logger.info(f"Mobile action requested: {params.action} on {params.selector}")
-            
-            # Notify Telegram
-            telegram_msg = (
-                f"📱 *Mobile Action Requested*\n\n"
-                f"*Task ID:* `{request.taskId}`\n"
-                f"*Action:* `{params.action}`\n"
-                f"*Selector:* `{params.selector}`"
-            )
-            await notifier.send_message(telegram_msg)
-            
+            logger.info("Mobile action requested: %s on %s", params.action, params.selector)
+            if notifier.enabled:
+                notifier.enqueue(_TELEGRAM_TEMPLATES["mobile_action"].format(
+                    task_id=request.taskId, action=params.action, selector=params.selector,
+                ))
             return {
                 "action": step_type,
                 "selector": params.selector,
                 "status": "queued_for_execution",
-                "telegram_sent": True,
+                "telegram_queued": notifier.enabled,
             }
 
         elif step_type == "extract":
             # Extract data
-            logger.info(f"Extract requested from {params.selector}")
-            
-            # Notify Telegram
-            telegram_msg = (
-                f"🔍 *Data Extraction Requested*\n\n"
-                f"*Task ID:* `{request.taskId}`\n"
-                f"*Selector:* `{params.selector}`"
-            )
-            await notifier.send_message(telegram_msg)
-            
+            logger.info("Extract requested from %s", params.selector)
+            if notifier.enabled:
+                notifier.enqueue(_TELEGRAM_TEMPLATES["extract"].format(
+                    task_id=request.taskId, selector=params.selector,
+                ))
             return {
                 "action": "extract",
                 "selector": params.selector,
                 "status": "acknowledged",
-                "telegram_sent": True,
+                "telegram_queued": notifier.enabled,
             }
 
         else:
-            logger.warning(f"Unhandled step type: {step_type}")
-            
-            # Still notify Telegram for unhandled types
-            telegram_msg = (
-                f"⚠️ *Unhandled Webhook Step*\n\n"
-                f"*Task ID:* `{request.taskId}`\n"
-                f"*Step Type:* `{step_type}`\n"
-                f"*Params:* `{json.dumps(params.model_dump(), default=str)[:200]}`"
-            )
-            await notifier.send_message(telegram_msg)
-            
-            return {"status": "unhandled", "step_type": step_type, "telegram_sent": True}
+            logger.warning("Unhandled step type: %s", step_type)
+
+            # Still notify Telegram for unhandled types; only fields the sender set
+            if notifier.enabled:
+                set_params = {name: getattr(params, name) for name in params.model_fields_set}
+                notifier.enqueue(_TELEGRAM_TEMPLATES["unhandled"].format(
+                    task_id=request.taskId,
+                    step_type=step_type,
+                    params=_json_dumps(set_params)[:200].decode("utf-8", errors="replace"),
+                ))
+            return {"status": "unhandled", "step_type": step_type, "telegram_queued": notifier.enabled}
+
+    def _evict(self, run_ids: list[str]) -> None:
+        """Drop tasks from the queue and keep the taskId index pointing at live runs."""
+        stale_task_ids = set()
+        for run_id in run_ids:
+            info = self._tasks.pop(run_id)
+            if self._task_id_index.get(info.task_id) == run_id:
+                del self._task_id_index[info.task_id]
+                stale_task_ids.add(info.task_id)
+        if stale_task_ids:
+            # Re-point at the oldest surviving run, as before eviction
+            for run_id, info in self._tasks.items():
+                if info.task_id in stale_task_ids:
+                    self._task_id_index.setdefault(info.task_id, run_id)
+
+    def _evict_over_capacity(self) -> None:
+        """
+        Evict the oldest finished tasks once the queue is over MAX_TASKS.
+
+        Trims down to 90% of MAX_TASKS, so the O(n) scan and index re-pointing
+        run once per batch of inserts rather than on every one.
+        """
+        excess = len(self._tasks) - self.MAX_TASKS * 9 // 10
+        oldest_finished = (
+            run_id for run_id, info in self._tasks.items() if info.status in _TERMINAL_STATUSES
+        )
+        self._evict(list(itertools.islice(oldest_finished, excess)))
+
+    def _ensure_eviction_task(self) -> None:
+        """Start the TTL eviction loop on first use."""
+        if self._eviction_task is None or self._eviction_task.done():
+            self._eviction_task = asyncio.create_task(self._eviction_loop())
+
+    async def _eviction_loop(self) -> None:
+        """Periodically evict finished tasks older than TASK_TTL."""
+        while True:
+            await asyncio.sleep(self.EVICTION_INTERVAL)
+            cutoff = time.time() - self.TASK_TTL
+            expired = [
+                run_id for run_id, info in self._tasks.items()
+                if info.status in _TERMINAL_STATUSES and info.updated_at < cutoff
+            ]
+            if expired:
+                self._evict(expired)
+                logger.info("Evicted %d finished OpenClaw tasks", len(expired))
+
+    async def aclose(self) -> None:
+        """Stop the eviction loop."""
+        if self._eviction_task is not None:
+            self._eviction_task.cancel()
+            try:
+                await self._eviction_task
+            except asyncio.CancelledError:
+                pass
+            self._eviction_task = None
 
     def get_task_status(self, run_id: str) -> Optional[TaskInfo]:
         """Get the status of a task by run_id."""
-        return _task_queue.get(run_id)
+        return self._tasks.get(run_id)
 
     def get_all_tasks(self, limit: int = 100) -> list[TaskInfo]:
         """Get all tasks, most recent first."""
-        tasks = list(_task_queue.values())
-        tasks.sort(key=lambda t: t.created_at, reverse=True)
-        return tasks[:limit]
+        # _tasks is filled in creation order, so reversed() is newest first
+        return list(itertools.islice(reversed(self._tasks.values()), limit))
 
     def get_task_by_task_id(self, task_id: str) -> Optional[TaskInfo]:
         """Get task by original taskId from OpenClaw."""
-        for task in _task_queue.values():
-            if task.task_id == task_id:
-                return task
-        return None
+        run_id = self._task_id_index.get(task_id)
+        return self._tasks.get(run_id) if run_id is not None else None
 
 
 # Singleton instance (initialized in router)
@@ -540,3 +842,10 @@ def init_openclaw_service(hook_token: str) -> OpenClawService:
     _openclaw_service = OpenClawService(hook_token=hook_token)
     logger.info("OpenClaw service initialized")
     return _openclaw_service
+
+
+async def shutdown_openclaw_service() -> None:
+    """Stop the OpenClaw service's background work and close the Telegram notifier."""
+    if _openclaw_service is not None:
+        await _openclaw_service.aclose()
+    await shutdown_telegram_notifier()
@@ -11,14 +11,135 @@ Keeps it simple - focuses on tab-specific tasks.
 import asyncio
 import logging
 import os
-from dataclasses import dataclass, field
-from typing import Optional, List
+import random
+import time
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Optional, Sequence
 from datetime import datetime
 
+import httpx
+
 logger = logging.getLogger("ironclaw.services.tab_execution")
 
+_UNSET = object()
+# ironclaw_mobilerun module, or None if it is not installed; resolved once
+_mobilerun = _UNSET
+
+
+def _load_mobilerun():
+    """Import ironclaw_mobilerun on first use and remember the outcome."""
+    global _mobilerun
+    if _mobilerun is _UNSET:
+        try:
+            import ironclaw_mobilerun as module
+        except ImportError:
+            logger.warning("MobileRun client not available")
+            module = None
+        _mobilerun = module
+    return _mobilerun
+
+
+def _is_transient(exc: Exception) -> bool:
+    """
+    Whether a MobileRun failure is worth retrying.
+
+    run_task_v2 creates a task, so only failures where the request cannot
+    have reached MobileRun, or a gateway/overload status, are retried; a read
+    timeout may already have started the task on the device.
+    """
+    if isinstance(exc, (httpx.ConnectError, httpx.ConnectTimeout, httpx.PoolTimeout)):
+        return True
+    if isinstance(exc, httpx.HTTPStatusError):
+        return exc.response.status_code in (502, 503, 504)
+    return False
+
+
+# Task prompts, built once; _CLOSE_OLD_TABS_TASK takes {max_tabs}
+_ORGANIZE_TABS_TASK = """
+        Open Chrome and organize all open tabs into logical groups.
+
+        Follow these physical steps:
+        1. Unlock the device if locked (swipe up from bottom).
+        2. Open the Chrome app.
+        3. Tap the tab switcher icon (box with number) to view open tabs.
+        4. LOOK at the screen to identify visible tabs.
+        5. Scroll down slowly to reveal more tabs. 
+           - **CRITICAL**: If you cannot scroll down further (bottom reached), scroll UP to review tabs you might have missed.
+           - Ensure you have seen ALL open tabs.
+        6. Group tabs by content type - let the groups emerge naturally:
+           - Group work-related tabs together (GitHub, docs, work tools)
+           - Group social media tabs (Twitter, LinkedIn, Reddit)
+           - Group shopping tabs (Amazon, eBay, product pages)
+           - Group news/media/entertainment
+           - Group research/learning
+        7. To group tabs: Long press a tab and drag it over another similar tab, OR tap the menu on a tab and select "Group tabs".
+        8. Name each group descriptively.
+        9. Take a screenshot of the final organized view.
+        
+        Important:
+        - USE VISION: Look at the screenshots to read tab titles accurately.
+        - Stop scrolling if you see the same tabs repeatedly.
+        - If the list is short, scroll up and down once to confirm.
+        """
+
+_MERGE_DUPLICATES_TASK = """
+        Open Chrome and find duplicate tabs to close.
 
-@dataclass
+        Follow these physical steps:
+        1. Unlock the device if locked.
+        2. Open the Chrome app.
+        3. Tap the tab switcher icon.
+        4. LOOK at the screen to identify visible tabs.
+        5. Scroll through the list (down AND up) to view all titles.
+           - If you reach the bottom, scroll back up to double-check.
+        6. Identify tabs with the same URL (duplicates) by visually comparing titles/URLs.
+        7. For each set of duplicates, tap the "X" on the older tabs to close them. Keep the most recent one.
+        8. Count how many duplicate tabs were closed.
+        9. Take a screenshot before and after.
+
+        Important:
+        - USE VISION: Verify titles match exactly before closing.
+        - Do not get stuck scrolling at the bottom - scroll up if needed.
+        """
+
+_CLOSE_OLD_TABS_TASK = """
+        Open Chrome and close old/stale tabs.
+
+        Follow these physical steps:
+        1. Unlock the device if locked.
+        2. Open Chrome.
+        3. Tap the tab switcher icon.
+        4. Scroll through the list (down then up) to find old or unused ones.
+        5. Look for tabs that seem abandoned (e.g., "New Tab", outdated searches).
+        6. Tap the "X" button on these tabs to close them.
+        7. Close up to {max_tabs} old tabs.
+        8. Do NOT close tabs with unsaved forms or important work.
+        
+        Important:
+        - USE VISION: Look closely at tab thumbnails/titles.
+        - Scroll up if you hit the bottom to ensure you checked everything.
+        """
+
+_LIST_TABS_TASK = """
+        Open Chrome and list all open tabs.
+
+        Follow these physical steps:
+        1. Unlock the device if locked.
+        2. Open Chrome.
+        3. Tap the tab switcher icon.
+        4. Scroll through the entire list of tabs (down then up).
+        5. USE VISION: Read the title and URL of every visible tab.
+        6. Report the total count of tabs found.
+        7. Take a screenshot of the tab overview.
+        
+        Important:
+        - If you reach the bottom, scroll up to view the top tabs again.
+        - Ensure you capture details from the WHOLE list.
+        """
+
+
+@dataclass(slots=True)
 class TabInfo:
     """Represents a Chrome tab."""
 
@@ -29,20 +150,25 @@ class TabInfo:
     group: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class TabExecutionResult:
-    """Result from a tab operation."""
+    """
+    Result from a tab operation.
+
+    Sequence fields default to a shared empty tuple rather than a fresh list
+    per instance; callers that have items pass their own list.
+    """
 
     success: bool
     message: str
-    tabs: List[TabInfo] = field(default_factory=list)
+    tabs: Sequence[TabInfo] = ()
     groups_created: int = 0
     tabs_closed: int = 0
     duplicates_merged: int = 0
-    screenshots: List[str] = field(default_factory=list)
+    screenshots: Sequence[str] = ()
     task_id: Optional[str] = None
     error: Optional[str] = None
-    steps: List[dict] = field(default_factory=list)  # Parsed step information
+    steps: Sequence[dict] = ()  # Parsed step information
 
 
 class TabExecutionService:
@@ -55,6 +181,16 @@ class TabExecutionService:
 
     CHROME_PACKAGE = "com.android.chrome"
 
+    # Retries of transient MobileRun errors before falling back to Droidrun
+    RETRY_ATTEMPTS = 3
+    RETRY_BASE_DELAY = 0.5  # seconds, doubled per attempt
+    RETRY_MAX_DELAY = 4.0
+    # After this many consecutive MobileRun failures, skip it for a while
+    BREAKER_THRESHOLD = 3
+    BREAKER_COOLDOWN = 30.0  # seconds
+    # Client-side deadline for one MobileRun task submission
+    MOBILERUN_DEADLINE = float(os.getenv("MOBILERUN_DEADLINE", "120"))
+
     def __init__(
         self,
         mobilerun_api_key: Optional[str] = None,
@@ -63,16 +199,17 @@ class TabExecutionService:
         self.api_key = mobilerun_api_key or os.getenv("MOBILERUN_API_KEY")
         self.device_id = mobilerun_device_id or os.getenv("MOBILERUN_DEVICE_ID")
         self._client = None
+        self._consecutive_failures = 0
+        self._breaker_open_until = 0.0  # time.monotonic() deadline
+        # Caps concurrent MobileRun submissions below the cloud's own limit
+        self._mobilerun_slots = asyncio.Semaphore(int(os.getenv("MOBILERUN_MAX_INFLIGHT", "8")))
 
     def _get_client(self):
         """Lazy-load MobileRun client."""
         if self._client is None and self.api_key:
-            try:
-                from ironclaw_mobilerun import MobileRunClient
-
-                self._client = MobileRunClient(api_key=self.api_key)
-            except ImportError:
-                logger.warning("MobileRun client not available")
+            mobilerun = _load_mobilerun()
+            if mobilerun is not None:
+                self._client = mobilerun.MobileRunClient(api_key=self.api_key)
         return self._client
 
     async def _execute_via_mobilerun(self, task: str, max_steps: int = 50) -> dict:
@@ -81,22 +218,34 @@ class TabExecutionService:
         if not client:
             raise RuntimeError("MobileRun client not configured")
 
-        try:
-            from ironclaw_mobilerun import LLMModel
-
-            result = await client.run_task_v2(
-                task=task,
-                llm_model=LLMModel.GEMINI_25_FLASH,
-                device_id=self.device_id,
-                max_steps=max_steps,
-                vision=True,
-                reasoning=True,
-                apps=[self.CHROME_PACKAGE],
-            )
-            return result
-        except Exception as e:
-            logger.error(f"MobileRun execution failed: {e}")
-            raise
+        for attempt in range(1, self.RETRY_ATTEMPTS + 1):
+            try:
+                # Held per attempt, so backoff sleeps don't occupy a slot; a
+                # deadline overrun is not retried and falls back to Droidrun
+                async with self._mobilerun_slots:
+                    result = await asyncio.wait_for(
+                        client.run_task_v2(
+                            task=task,
+                            llm_model=_load_mobilerun().LLMModel.GEMINI_25_FLASH,
+                            device_id=self.device_id,
+                            max_steps=max_steps,
+                            vision=True,
+                            reasoning=True,
+                            apps=[self.CHROME_PACKAGE],
+                        ),
+                        timeout=self.MOBILERUN_DEADLINE,
+                    )
+                return result
+            except Exception as e:
+                if attempt == self.RETRY_ATTEMPTS or not _is_transient(e):
+                    logger.error(f"MobileRun execution failed: {e}")
+                    raise
+                # Exponential backoff with full jitter
+                delay = min(self.RETRY_MAX_DELAY, self.RETRY_BASE_DELAY * 2 ** (attempt - 1))
+                logger.warning(
+                    f"MobileRun attempt {attempt} failed ({e}), retrying in <= {delay:.1f}s"
+                )
+                await asyncio.sleep(random.uniform(0, delay))
 
     async def _execute_via_droidrun(self, goal: str) -> dict:
         """Fallback: Execute via local Droidrun agent and extract steps."""
@@ -141,17 +290,30 @@ class TabExecutionService:
     ) -> dict:
         """
         Execute task with hybrid approach:
-        1. Try MobileRun first
-        2. Fall back to Droidrun if MobileRun fails
+        1. Try MobileRun first, retrying transient errors
+        2. Fall back to Droidrun if MobileRun fails, skipping MobileRun
+           for BREAKER_COOLDOWN after BREAKER_THRESHOLD failures in a row
         """
-        # Try MobileRun first
+        # Try MobileRun first, unless it has been failing repeatedly
         if self.api_key and self.device_id:
-            try:
-                logger.info(f"Executing via MobileRun: {task[:50]}...")
-                result = await self._execute_via_mobilerun(task, max_steps)
-                return {"backend": "mobilerun", **result}
-            except Exception as e:
-                logger.warning(f"MobileRun failed, falling back to Droidrun: {e}")
+            if time.monotonic() < self._breaker_open_until:
+                logger.info("MobileRun circuit open, going straight to Droidrun")
+            else:
+                try:
+                    logger.info(f"Executing via MobileRun: {task[:50]}...")
+                    result = await self._execute_via_mobilerun(task, max_steps)
+                    self._consecutive_failures = 0
+                    return {"backend": "mobilerun", **result}
+                except Exception as e:
+                    self._consecutive_failures += 1
+                    if self._consecutive_failures >= self.BREAKER_THRESHOLD:
+                        self._breaker_open_until = time.monotonic() + self.BREAKER_COOLDOWN
+                        self._consecutive_failures = 0
+                        logger.warning(
+                            f"MobileRun failed {self.BREAKER_THRESHOLD} times in a row, "
+                            f"skipping it for {self.BREAKER_COOLDOWN:.0f}s"
+                        )
+                    logger.warning(f"MobileRun failed, falling back to Droidrun: {e}")
 
         # Fallback to Droidrun
         try:
@@ -170,32 +332,7 @@ class TabExecutionService:
         """
         Organize Chrome tabs into AI-determined groups.
         """
-        task = """
-        Open Chrome and organize all open tabs into logical groups.
-
-        Follow these physical steps:
-        1. Unlock the device if locked (swipe up from bottom).
-        2. Open the Chrome app.
-        3. Tap the tab switcher icon (box with number) to view open tabs.
-        4. LOOK at the screen to identify visible tabs.
-        5. Scroll down slowly to reveal more tabs. 
-           - **CRITICAL**: If you cannot scroll down further (bottom reached), scroll UP to review tabs you might have missed.
-           - Ensure you have seen ALL open tabs.
-        6. Group tabs by content type - let the groups emerge naturally:
-           - Group work-related tabs together (GitHub, docs, work tools)
-           - Group social media tabs (Twitter, LinkedIn, Reddit)
-           - Group shopping tabs (Amazon, eBay, product pages)
-           - Group news/media/entertainment
-           - Group research/learning
-        7. To group tabs: Long press a tab and drag it over another similar tab, OR tap the menu on a tab and select "Group tabs".
-        8. Name each group descriptively.
-        9. Take a screenshot of the final organized view.
-        
-        Important:
-        - USE VISION: Look at the screenshots to read tab titles accurately.
-        - Stop scrolling if you see the same tabs repeatedly.
-        - If the list is short, scroll up and down once to confirm.
-        """
+        task = _ORGANIZE_TABS_TASK
 
         try:
             result = await self._execute_hybrid(task, max_steps=60)
@@ -227,25 +364,7 @@ class TabExecutionService:
         """
         Find and close duplicate Chrome tabs.
         """
-        task = """
-        Open Chrome and find duplicate tabs to close.
-
-        Follow these physical steps:
-        1. Unlock the device if locked.
-        2. Open the Chrome app.
-        3. Tap the tab switcher icon.
-        4. LOOK at the screen to identify visible tabs.
-        5. Scroll through the list (down AND up) to view all titles.
-           - If you reach the bottom, scroll back up to double-check.
-        6. Identify tabs with the same URL (duplicates) by visually comparing titles/URLs.
-        7. For each set of duplicates, tap the "X" on the older tabs to close them. Keep the most recent one.
-        8. Count how many duplicate tabs were closed.
-        9. Take a screenshot before and after.
-
-        Important:
-        - USE VISION: Verify titles match exactly before closing.
-        - Do not get stuck scrolling at the bottom - scroll up if needed.
-        """
+        task = _MERGE_DUPLICATES_TASK
 
         try:
             result = await self._execute_hybrid(task, max_steps=40)
@@ -280,23 +399,7 @@ class TabExecutionService:
         Args:
             max_tabs: Maximum number of tabs to close in one session
         """
-        task = f"""
-        Open Chrome and close old/stale tabs.
-
-        Follow these physical steps:
-        1. Unlock the device if locked.
-        2. Open Chrome.
-        3. Tap the tab switcher icon.
-        4. Scroll through the list (down then up) to find old or unused ones.
-        5. Look for tabs that seem abandoned (e.g., "New Tab", outdated searches).
-        6. Tap the "X" button on these tabs to close them.
-        7. Close up to {max_tabs} old tabs.
-        8. Do NOT close tabs with unsaved forms or important work.
-        
-        Important:
-        - USE VISION: Look closely at tab thumbnails/titles.
-        - Scroll up if you hit the bottom to ensure you checked everything.
-        """
+        task = _CLOSE_OLD_TABS_TASK.format(max_tabs=max_tabs)
 
         try:
             result = await self._execute_hybrid(task, max_steps=40)
@@ -328,22 +431,7 @@ class TabExecutionService:
         """
         Get a list of all currently open Chrome tabs.
         """
-        task = """
-        Open Chrome and list all open tabs.
-
-        Follow these physical steps:
-        1. Unlock the device if locked.
-        2. Open Chrome.
-        3. Tap the tab switcher icon.
-        4. Scroll through the entire list of tabs (down then up).
-        5. USE VISION: Read the title and URL of every visible tab.
-        6. Report the total count of tabs found.
-        7. Take a screenshot of the tab overview.
-        
-        Important:
-        - If you reach the bottom, scroll up to view the top tabs again.
-        - Ensure you capture details from the WHOLE list.
-        """
+        task = _LIST_TABS_TASK
 
         try:
             result = await self._execute_hybrid(task, max_steps=20)
@@ -383,13 +471,7 @@ class TabExecutionService:
         return None
 
 
-# Singleton instance
-_tab_service: Optional[TabExecutionService] = None
-
-
+@lru_cache(maxsize=1)
 def get_tab_execution_service() -> TabExecutionService:
     """Get the singleton tab execution service."""
-    global _tab_service
-    if _tab_service is None:
-        _tab_service = TabExecutionService()
-    return _tab_service
+    return TabExecutionService()
@@ -3,7 +3,8 @@ Configuration management for Iron Claw.
 Loads settings from environment variables and config files.
 """
 
-from functools import lru_cache
+import os
+from functools import cached_property, lru_cache
 from pathlib import Path
 from typing import Optional
 
@@ -11,15 +12,29 @@ import yaml
 from pydantic import Field
 from pydantic_settings import BaseSettings
 
+try:
+    # libyaml-backed loader, when PyYAML was built with it
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader
+
 
 # Find the monorepo root (has pyproject.toml with [tool.uv.workspace])
+@lru_cache(maxsize=1)
 def find_monorepo_root() -> Path:
     """Find the monorepo root directory."""
-    current = Path(__file__).resolve()
-    for parent in current.parents:
-        if (parent / "pyproject.toml").exists() and (parent / "apps").exists():
-            return parent
-    return Path.cwd()
+    # __file__ is already absolute, so walk it with plain string ops instead of
+    # resolving it; only the two marker checks touch the filesystem
+    current = os.path.dirname(os.path.abspath(__file__))
+    while True:
+        if os.path.isfile(os.path.join(current, "pyproject.toml")) and os.path.isdir(
+            os.path.join(current, "apps")
+        ):
+            return Path(current)
+        parent = os.path.dirname(current)
+        if parent == current:
+            return Path.cwd()
+        current = parent
 
 
 MONOREPO_ROOT = find_monorepo_root()
@@ -77,10 +92,15 @@ class AppConfig:
             # -> utils -> ironclaw -> src -> gateway
             config_path = Path(__file__).parent.parent.parent.parent / "config.yaml"
 
-        self._config = {}
-        if config_path.exists():
-            with open(config_path) as f:
-                self._config = yaml.safe_load(f) or {}
+        self._config_path = config_path
+
+    @cached_property
+    def _config(self) -> dict:
+        """Parsed YAML, read on first access so unused configs cost nothing."""
+        if not self._config_path.exists():
+            return {}
+        with open(self._config_path, "rb") as f:
+            return yaml.load(f, Loader=_YamlLoader) or {}
 
     @property
     def safe_packages(self) -> list[str]:
@@ -7,11 +7,23 @@ for display in the frontend chat interface.
 
 import re
 import json
-from dataclasses import dataclass, asdict
-from typing import Optional
-
-
-@dataclass
+from dataclasses import dataclass
+from itertools import islice
+from typing import Iterator, Optional
+
+_STEP_RE = re.compile(r"🔄 Step (\d+)/(\d+)")
+_ACTION_RE = re.compile(r'\{"action":\s*"([^"]+)"')
+# Strips a timestamp/logger prefix like "2026-01-20 12:44:12,551 - droidrun - INFO - "
+# and then a PM2/gateway prefix like "0|gateway  | ", in one pass
+_PREFIX_RE = re.compile(
+    r"^(?:\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2},\d{3} - [\w\.]+ - \w+ - )?"
+    r"(?:\d+\|[\w\-]+\s*\|\s*)?"
+)
+# Any of the literals the per-line patterns above look for
+_MARKER_RE = re.compile(r'🔄 Step|### Description ###|\{"action":')
+
+
+@dataclass(slots=True)
 class StepInfo:
     """Represents a single step in agent execution."""
 
@@ -21,7 +33,13 @@ class StepInfo:
     action: Optional[str] = None
 
     def to_dict(self) -> dict:
-        return asdict(self)
+        # Flat and immutable fields: no need for asdict's recursive copy
+        return {
+            "step_number": self.step_number,
+            "total_steps": self.total_steps,
+            "description": self.description,
+            "action": self.action,
+        }
 
 
 def parse_step_logs(logs: str) -> list[StepInfo]:
@@ -39,99 +57,100 @@ def parse_step_logs(logs: str) -> list[StepInfo]:
     Returns:
         List of StepInfo objects
     """
-    if not logs:
-        return []
+    return list(_iter_step_logs(logs))
+
 
-    steps: list[StepInfo] = []
-    lines = logs.split("\n")
+def _iter_step_logs(logs: str) -> Iterator[StepInfo]:
+    """Yield steps from logs as they complete, so callers can stop early."""
+    if not logs:
+        return
 
     current_step_num = 0
     current_total = 0
     current_description = ""
     current_action = ""
 
-    # Patterns
-    step_pattern = re.compile(r"🔄 Step (\d+)/(\d+)")
-    desc_pattern = re.compile(r"### Description ###")
-    action_pattern = re.compile(r'\{"action":\s*"([^"]+)"')
-    # Pattern to strip timestamp and logger prefixes like "2026-01-20 12:44:12,551 - droidrun - INFO - "
-    timestamp_prefix_pattern = re.compile(
-        r"^\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2},\d{3} - [\w\.]+ - \w+ - "
-    )
-    # Pattern to strip PM2/gateway log prefixes like "0|gateway  | "
-    log_prefix_pattern = re.compile(r"^\d+\|[\w\-]+\s*\|\s*")
-
-    i = 0
-    while i < len(lines):
-        line = lines[i]
-
-        # Strip timestamp and PM2 prefixes before processing
-        clean_line = timestamp_prefix_pattern.sub("", line)
-        clean_line = log_prefix_pattern.sub("", clean_line)
-        clean_line = clean_line.strip()
-
+    # Jump straight to lines containing a marker instead of splitting and
+    # walking every line. Markers never occur inside the stripped prefixes, so
+    # raw lines can be matched directly; only descriptions need prefix removal.
+    # Bound methods hoisted out of the loop
+    find = logs.find
+    rfind = logs.rfind
+    search_step = _STEP_RE.search
+    search_action = _ACTION_RE.search
+    strip_prefix = _PREFIX_RE.sub
+    logs_len = len(logs)
+
+    consumed = 0  # offset of the first line not yet processed
+    for marker in _MARKER_RE.finditer(logs):
+        marker_start = marker.start()
+        if marker_start < consumed:
+            continue
+        line_start = rfind("\n", 0, marker_start) + 1
+        line_end = find("\n", marker_start)
+        if line_end == -1:
+            line_end = logs_len
+        consumed = line_end + 1
+        line = logs[line_start:line_end]
+
+        # Cheap literal checks first; the regexes only run to extract fields
         # Check for step marker
-        step_match = step_pattern.search(clean_line)
+        step_match = search_step(line) if "🔄 Step" in line else None
         if step_match:
             # Save previous step if exists
             if current_step_num > 0 and current_description:
-                steps.append(
-                    StepInfo(
-                        step_number=current_step_num,
-                        total_steps=current_total,
-                        description=current_description.strip(),
-                        action=current_action if current_action else None,
-                    )
+                yield StepInfo(
+                    step_number=current_step_num,
+                    total_steps=current_total,
+                    description=current_description.strip(),
+                    action=current_action if current_action else None,
                 )
 
             current_step_num = int(step_match.group(1))
             current_total = int(step_match.group(2))
             current_description = ""
             current_action = ""
-            i += 1
             continue
 
         # Check for description marker
-        if desc_pattern.search(clean_line):
+        if "### Description ###" in line:
             # Get the next non-empty line as description
-            j = i + 1
-            while j < len(lines) and not lines[j].strip():
-                j += 1
-            if j < len(lines):
-                desc_line = lines[j]
-                # Strip all prefixes
-                desc_line = timestamp_prefix_pattern.sub("", desc_line)
-                desc_line = log_prefix_pattern.sub("", desc_line)
-                current_description = desc_line.strip()
-            i = j + 1
+            while consumed <= logs_len:
+                next_end = find("\n", consumed)
+                if next_end == -1:
+                    next_end = logs_len
+                desc_line = logs[consumed:next_end]
+                consumed = next_end + 1
+                if desc_line.strip():
+                    # Strip all prefixes
+                    current_description = strip_prefix("", desc_line, count=1).strip()
+                    break
             continue
 
         # Check for action JSON
-        action_match = action_pattern.search(clean_line)
+        action_match = search_action(line) if '{"action":' in line else None
         if action_match:
             current_action = action_match.group(1)
 
-        i += 1
-
     # Don't forget the last step
     if current_step_num > 0 and current_description:
-        steps.append(
-            StepInfo(
-                step_number=current_step_num,
-                total_steps=current_total,
-                description=current_description.strip(),
-                action=current_action if current_action else None,
-            )
+        yield StepInfo(
+            step_number=current_step_num,
+            total_steps=current_total,
+            description=current_description.strip(),
+            action=current_action if current_action else None,
         )
 
-    return steps
-
 
 def format_steps_for_response(steps: list[StepInfo]) -> list[dict]:
     """Convert StepInfo list to dict list for JSON response."""
     return [step.to_dict() for step in steps]
 
 
+def _shorten(desc: str, width: int = 50) -> str:
+    return desc if len(desc) <= width else desc[:width] + "..."
+
+
 def extract_step_summary(logs: str) -> str:
     """
     Extract a brief summary of steps from logs.
@@ -139,17 +158,17 @@ def extract_step_summary(logs: str) -> str:
     Returns a condensed string like:
     "Step 1/30: Clicking element... → Step 2/30: Scrolling..."
     """
-    steps = parse_step_logs(logs)
+    # Only parse far enough to know whether there is anything past the first 5
+    steps = list(islice(_iter_step_logs(logs), 6))
     if not steps:
         return ""
 
-    summaries = []
-    for step in steps[:5]:  # Limit to first 5 steps for summary
-        desc = step.description[:50] + "..." if len(step.description) > 50 else step.description
-        summaries.append(f"Step {step.step_number}/{step.total_steps}: {desc}")
-
-    result = " → ".join(summaries)
+    # Limit to first 5 steps for summary
+    result = " → ".join(
+        f"Step {step.step_number}/{step.total_steps}: {_shorten(step.description)}"
+        for step in islice(steps, 5)
+    )
     if len(steps) > 5:
-        result += f" ... (+{len(steps) - 5} more steps)"
+        result += " ... (+more steps)"
 
     return result
@@ -1,16 +1,79 @@
 """
 Test configuration for Iron Claw Gateway.
 """
+import os
+
+# Set before anything imports ironclaw: the OpenClaw router reads it at import
+# time, and the webhook tests authenticate with this exact token
+os.environ["OPENCLAW_HOOK_TOKEN"] = "test-secret-token"
+
 import pytest
-import asyncio
+import pytest_asyncio
+import time
+
+
+@pytest.fixture(scope="session", autouse=True)
+def _skip_openclaw_step_execution():
+    """
+    Complete queued OpenClaw runs without executing their steps.
+
+    Tests only check how runs are queued and reported; running the default
+    processor would notify Telegram if a bot token is present in .env.
+
+    The TTL eviction loop is not started either: runs are queued from both the
+    TestClient's loop and the pytest-asyncio session loop, and the loop would be bound to
+    whichever came first, breaking shutdown from the other.
+    """
+    from ironclaw.services.openclaw_service import OpenClawService, TaskStatus
+
+    async def _complete(self, task_info, request):
+        task_info.status = TaskStatus.COMPLETED
+        task_info.result = {}
+        task_info.updated_at = time.time()
+
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(OpenClawService, "_run_task", _complete)
+        mp.setattr(OpenClawService, "_ensure_eviction_task", lambda self: None)
+        yield
 
 
 @pytest.fixture(scope="session")
-def event_loop():
-    """Create an event loop for the test session."""
-    loop = asyncio.new_event_loop()
-    yield loop
-    loop.close()
+def client():
+    """Test client shared by the whole session, so the app starts up once."""
+    from fastapi.testclient import TestClient
+    from ironclaw.main import app
+
+    with TestClient(app) as c:
+        yield c
+
+
+@pytest.fixture(scope="session")
+def lite_client():
+    """
+    Test client for an app that mounts only the OpenClaw router.
+
+    For tests that expect a request to be rejected before anything is queued:
+    it avoids importing the full gateway (device agents, every other router).
+    """
+    from fastapi import FastAPI
+    from fastapi.testclient import TestClient
+    from ironclaw.api import openclaw
+
+    app = FastAPI()
+    app.include_router(openclaw.router, prefix="/openclaw")
+    with TestClient(app) as c:
+        yield c
+
+
+@pytest_asyncio.fixture(scope="session")
+async def async_client():
+    """Async client over ASGI, for tests that fire several requests concurrently."""
+    import httpx
+    from ironclaw.main import app
+
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as ac:
+        yield ac
 
 
 @pytest.fixture
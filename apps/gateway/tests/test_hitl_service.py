@@ -2,14 +2,19 @@
 Tests for the HITL (Human-in-the-Loop) service.
 """
 import pytest
+import pytest_asyncio
 import asyncio
+import base64
+import gc
 from ironclaw.services.hitl_service import HITLService, HITLTimeoutError
 
 
-@pytest.fixture
-def hitl_service():
+@pytest_asyncio.fixture
+async def hitl_service():
     """Create a fresh HITL service for each test."""
-    return HITLService()
+    service = HITLService()
+    yield service
+    await service.aclose()
 
 
 class TestHITLService:
@@ -139,3 +144,238 @@ class TestHITLService:
 
         assert len(received_requests) == 1
         assert received_requests[0]["task_id"] == "callback-test"
+
+    @pytest.mark.asyncio
+    async def test_screenshot_passed_as_raw_bytes(self, hitl_service):
+        """Test that screenshots reach callbacks as raw bytes, not base64."""
+        received_requests = []
+
+        async def callback(request):
+            received_requests.append(request)
+
+        hitl_service.register_callback(callback)
+
+        try:
+            await hitl_service.request_hitl(
+                task_id="screenshot-test",
+                hitl_type="test",
+                message="Testing screenshot",
+                screenshot=b"\x89PNG-bytes",
+                timeout_seconds=1,
+            )
+        except HITLTimeoutError:
+            pass
+
+        assert received_requests[-1]["screenshot_bytes"] == b"\x89PNG-bytes"
+
+    @pytest.mark.asyncio
+    async def test_api_returns_screenshot_as_base64(self, hitl_service, monkeypatch):
+        """Test that GET /hitl/{id} still returns the screenshot inline as base64."""
+        from ironclaw.api import hitl as hitl_api
+
+        monkeypatch.setattr(hitl_api, "get_hitl_service", lambda: hitl_service)
+        request_task = asyncio.create_task(hitl_service.request_hitl(
+            task_id="screenshot-api-test",
+            hitl_type="test",
+            message="Testing screenshot",
+            screenshot=b"\x89PNG-bytes",
+            timeout_seconds=5,
+        ))
+        await asyncio.sleep(0.05)
+        request_id = (await hitl_service.get_pending_requests())[0]["request_id"]
+
+        body = await hitl_api.get_request(request_id)
+
+        assert body["screenshot_base64"] == base64.b64encode(b"\x89PNG-bytes").decode()
+        assert body["has_screenshot"] is True
+        assert "screenshot_bytes" not in body
+
+        await hitl_service.cancel_request(request_id)
+        await request_task
+
+    @pytest.mark.asyncio
+    async def test_sweeper_expires_abandoned_request(self, hitl_service):
+        """Test that a request whose caller went away is expired by the sweeper."""
+        hitl_service.SWEEP_INTERVAL = 0.05
+
+        request_task = asyncio.create_task(
+            hitl_service.request_hitl(
+                task_id="abandoned",
+                hitl_type="test",
+                message="Caller will be cancelled",
+                timeout_seconds=0.1,
+            )
+        )
+        await asyncio.sleep(0.02)
+        request_id = (await hitl_service.get_pending_requests())[0]["request_id"]
+
+        # Caller disconnects before the timeout fires
+        request_task.cancel()
+        await asyncio.sleep(0.3)
+
+        request = await hitl_service.get_request(request_id)
+        assert request["status"] == "expired"
+        assert await hitl_service.get_pending_requests() == []
+
+    @pytest.mark.asyncio
+    async def test_respond_racing_timeout_is_consistent(self, hitl_service):
+        """Test that a response landing as the wait times out is either delivered or refused."""
+        outcomes = set()
+        for attempt in range(20):
+            request_task = asyncio.create_task(
+                hitl_service.request_hitl(
+                    task_id=f"race-{attempt}",
+                    hitl_type="test",
+                    message="Respond at the deadline",
+                    timeout_seconds=0.05,
+                )
+            )
+            await asyncio.sleep(0)
+            request_id = (await hitl_service.get_pending_requests(f"race-{attempt}"))[0]["request_id"]
+
+            # Land on both sides of the deadline across attempts
+            await asyncio.sleep(0.02 + (attempt % 5) * 0.015)
+            responded = await hitl_service.respond_hitl(request_id, "I solved it")
+
+            outcomes.add(responded)
+            if responded:
+                assert (await request_task)["action"] == "I solved it"
+                assert (await hitl_service.get_request(request_id))["status"] == "resolved"
+            else:
+                with pytest.raises(HITLTimeoutError):
+                    await request_task
+                assert (await hitl_service.get_request(request_id))["status"] == "expired"
+        assert outcomes == {True, False}
+
+    @pytest.mark.asyncio
+    async def test_respond_wakes_waiter_immediately(self, hitl_service):
+        """Test that a concurrent respond wakes the waiter without waiting for the timeout."""
+        loop = asyncio.get_running_loop()
+        started = loop.time()
+        request_task = asyncio.create_task(
+            hitl_service.request_hitl(
+                task_id="wake",
+                hitl_type="test",
+                message="Waiting",
+                timeout_seconds=30,
+            )
+        )
+        await asyncio.sleep(0)
+        request_id = (await hitl_service.get_pending_requests("wake"))[0]["request_id"]
+
+        assert await hitl_service.respond_hitl(request_id, "Retry")
+        response = await asyncio.wait_for(request_task, 1)
+
+        assert response["action"] == "Retry"
+        assert loop.time() - started < 1
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("outcome", ["approve", "reject", "timeout"])
+    async def test_pending_index_shrinks_on_transition(self, hitl_service, outcome):
+        """Test that a request leaves get_pending_requests() once it is approved, rejected or timed out."""
+        async def make_request(task_id, timeout):
+            try:
+                return await hitl_service.request_hitl(
+                    task_id=task_id,
+                    hitl_type="confirmation",
+                    message="Proceed?",
+                    timeout_seconds=timeout,
+                )
+            except HITLTimeoutError:
+                return None
+
+        target = asyncio.create_task(
+            make_request("target", 0.05 if outcome == "timeout" else 10)
+        )
+        other = asyncio.create_task(make_request("other", 10))
+        await asyncio.sleep(0)
+
+        assert len(await hitl_service.get_pending_requests()) == 2
+        request_id = (await hitl_service.get_pending_requests("target"))[0]["request_id"]
+
+        if outcome == "approve":
+            assert await hitl_service.respond_hitl(request_id, "Approve")
+        elif outcome == "reject":
+            assert await hitl_service.cancel_request(request_id)
+        await target
+
+        assert await hitl_service.get_pending_requests("target") == []
+        remaining = await hitl_service.get_pending_requests()
+        assert [r["task_id"] for r in remaining] == ["other"]
+
+        await hitl_service.cancel_request(remaining[0]["request_id"])
+        await other
+        assert await hitl_service.get_pending_requests() == []
+
+    @pytest.mark.asyncio
+    async def test_slow_or_failing_callbacks_do_not_block_respond(self, hitl_service):
+        """Test that a hanging or raising callback neither delays nor breaks the response."""
+        hitl_service.CALLBACK_TIMEOUT = 0.2
+        slow_cancelled = asyncio.Event()
+
+        async def slow_callback(request):
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                slow_cancelled.set()
+                raise
+
+        async def failing_callback(request):
+            raise RuntimeError("notification backend down")
+
+        hitl_service.register_callback(slow_callback)
+        hitl_service.register_callback(failing_callback)
+
+        request_task = asyncio.create_task(
+            hitl_service.request_hitl(
+                task_id="slow-callbacks",
+                hitl_type="test",
+                message="Callbacks misbehave",
+                timeout_seconds=10,
+            )
+        )
+        await asyncio.sleep(0)
+        request_id = (await hitl_service.get_pending_requests())[0]["request_id"]
+
+        assert await hitl_service.respond_hitl(request_id, "Retry")
+        response = await asyncio.wait_for(request_task, 0.1)
+        assert response["action"] == "Retry"
+        # The slow notification is still running; it is bounded by CALLBACK_TIMEOUT
+        assert not slow_cancelled.is_set()
+
+        await asyncio.wait_for(hitl_service.aclose(), 1)
+        assert slow_cancelled.is_set()
+        assert not hitl_service._pending_notifications
+
+    @pytest.mark.asyncio
+    async def test_notifications_are_kept_alive_and_drained_on_aclose(self, hitl_service):
+        """Test that in-flight notification tasks are strongly referenced and finish on aclose."""
+        delivered = []
+
+        async def callback(request):
+            await asyncio.sleep(0.05)
+            delivered.append(request["request_id"])
+
+        hitl_service.register_callback(callback)
+        request_task = asyncio.create_task(
+            hitl_service.request_hitl(
+                task_id="drain",
+                hitl_type="test",
+                message="Notify me",
+                timeout_seconds=10,
+            )
+        )
+        await asyncio.sleep(0)
+
+        # Nothing else references the notification task, so only the service keeps it alive
+        assert len(hitl_service._pending_notifications) == 1
+        gc.collect()
+        assert len(hitl_service._pending_notifications) == 1
+
+        await hitl_service.aclose()
+        request_id = (await hitl_service.get_pending_requests())[0]["request_id"]
+        assert delivered == [request_id]
+        assert not hitl_service._pending_notifications
+
+        await hitl_service.cancel_request(request_id)
+        await request_task
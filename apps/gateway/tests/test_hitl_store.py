@@ -0,0 +1,102 @@
+"""
+Tests for the Redis HITL store, run against fakeredis.
+"""
+import asyncio
+import time
+
+import pytest
+import pytest_asyncio
+from ironclaw.services.hitl_store import RedisHITLStore
+
+fakeredis = pytest.importorskip("fakeredis")
+
+
+def _request(request_id: str, task_id: str = "task-1") -> dict:
+    return {
+        "request_id": request_id,
+        "task_id": task_id,
+        "hitl_type": "captcha",
+        "message": "Solve it",
+        "screenshot_bytes": b"\x89PNG",
+        "options": ["Retry", "Abort"],
+        "created_at": "2025-01-01T00:00:00",
+        "expires_at": "2025-01-01T00:05:00",
+        "status": "pending",
+    }
+
+
+@pytest_asyncio.fixture
+async def store():
+    """A store over a fresh fake Redis server."""
+    client = fakeredis.FakeAsyncRedis(server=fakeredis.FakeServer())
+    yield RedisHITLStore(client=client)
+    await client.aclose()
+
+
+class TestRedisHITLStore:
+    """Test suite for RedisHITLStore."""
+
+    async def test_add_and_get_request(self, store):
+        """Test that a stored request reads back with its screenshot."""
+        await store.add_request(_request("hitl-1"))
+
+        request = await store.get_request("hitl-1")
+        assert request["task_id"] == "task-1"
+        assert request["status"] == "pending"
+        assert request["screenshot_bytes"] == b"\x89PNG"
+        assert await store.get_request("missing") is None
+
+    async def test_set_status_updates_pending_sets(self, store):
+        """Test that leaving "pending" removes a request from both pending sets."""
+        await store.add_request(_request("hitl-1", "task-a"))
+        await store.add_request(_request("hitl-2", "task-b"))
+
+        assert [r["request_id"] for r in await store.list_pending()] == ["hitl-1", "hitl-2"]
+        assert [r["request_id"] for r in await store.list_pending("task-a")] == ["hitl-1"]
+
+        await store.set_status("hitl-1", "cancelled")
+
+        assert (await store.get_request("hitl-1"))["status"] == "cancelled"
+        assert [r["request_id"] for r in await store.list_pending()] == ["hitl-2"]
+        assert await store.list_pending("task-a") == []
+
+    async def test_concurrent_transitions_have_one_winner(self, store):
+        """Test that only one of several racing transitions out of "pending" succeeds."""
+        await store.add_request(_request("hitl-1"))
+
+        results = await asyncio.gather(
+            store.transition("hitl-1", "pending", "resolved"),
+            store.transition("hitl-1", "pending", "expired"),
+            store.transition("hitl-1", "pending", "resolved"),
+        )
+
+        assert sorted(results) == [False, False, True]
+        assert await store.list_pending() == []
+        assert not await store.transition("missing", "pending", "resolved")
+
+    async def test_list_pending_prunes_expired_requests(self, store):
+        """Test that IDs whose request key expired are dropped from the pending sets."""
+        await store.add_request(_request("hitl-1"))
+        await store.add_request(_request("hitl-2"))
+        # hitl-1's key expired by TTL; hitl-2's score says it is past its TTL
+        await store._redis.delete("hitl:req:hitl-1")
+        for key in ("hitl:pending", "hitl:pending:task:task-1"):
+            await store._redis.zadd(key, {"hitl-2": time.time() - 1})
+
+        assert await store.list_pending() == []
+        assert await store._redis.zcard("hitl:pending") == 0
+        assert [r["request_id"] for r in await store.list_pending("task-1")] == []
+        assert await store._redis.zcard("hitl:pending:task:task-1") == 0
+
+    async def test_wait_response(self, store):
+        """Test that a waiter gets a response published while it waits, or None on timeout."""
+        await store.add_request(_request("hitl-1"))
+        waiter = asyncio.create_task(store.wait_response("hitl-1", timeout=2))
+        await asyncio.sleep(0.05)
+
+        await store.set_response("hitl-1", {"request_id": "hitl-1", "action": "Retry"})
+
+        assert (await waiter)["action"] == "Retry"
+        # A response recorded earlier is returned straight away
+        assert (await store.wait_response("hitl-1", timeout=0.1))["action"] == "Retry"
+        assert await store.wait_response("hitl-2", timeout=0.1) is None
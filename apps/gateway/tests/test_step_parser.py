@@ -0,0 +1,105 @@
+"""
+Unit tests for the step parser.
+
+Tests cover:
+- Step and description pairing
+- Prefix stripping and action capture
+- Edge cases at the end of the log
+- extract_step_summary truncation
+"""
+
+import pytest
+from ironclaw.utils.step_parser import (
+    StepInfo,
+    extract_step_summary,
+    parse_step_logs,
+)
+
+
+def _step_log(number, total, description, action=None):
+    """Log lines for one step, as the agent prints them."""
+    lines = [f"🔄 Step {number}/{total}", "### Description ###", description]
+    if action:
+        lines.append(f'{{"action": "{action}", "index": 3}}')
+    return "\n".join(lines)
+
+
+class TestParseStepLogs:
+    """Tests for parse_step_logs."""
+
+    def test_pairs_steps_with_descriptions_and_actions(self):
+        """Test that each step gets the description and action logged after it."""
+        logs = "\n".join([
+            "Starting agent",
+            _step_log(1, 3, "Open the settings app", "open_app"),
+            _step_log(2, 3, "Scroll down to Display"),
+        ])
+
+        assert parse_step_logs(logs) == [
+            StepInfo(1, 3, "Open the settings app", "open_app"),
+            StepInfo(2, 3, "Scroll down to Display", None),
+        ]
+
+    def test_strips_log_prefixes(self):
+        """Test that timestamp and PM2 prefixes are removed from descriptions."""
+        logs = "\n".join([
+            "0|gateway  | 2026-01-20 12:44:12,551 - droidrun - INFO - 🔄 Step 1/2",
+            "0|gateway  | ### Description ###",
+            "",
+            "2026-01-20 12:44:13,001 - droidrun - INFO - 0|gateway | Tap the search bar",
+            '0|gateway  | {"action":"tap", "index": 4}',
+        ])
+
+        assert parse_step_logs(logs) == [StepInfo(1, 2, "Tap the search bar", "tap")]
+
+    def test_description_on_last_line(self):
+        """Test that a description with no trailing newline is still captured."""
+        assert parse_step_logs(_step_log(4, 5, "Press back")) == [
+            StepInfo(4, 5, "Press back", None)
+        ]
+
+    @pytest.mark.parametrize(
+        "logs",
+        [
+            "",
+            "no markers here",
+            "🔄 Step 1/2\n### Description ###\n\n",
+            '🔄 Step 1/2\n{"action": "tap"}',
+        ],
+        ids=["empty", "no-markers", "marker-at-end", "no-description"],
+    )
+    def test_steps_without_description_are_dropped(self, logs):
+        """Test that a step is only reported once it has a description."""
+        assert parse_step_logs(logs) == []
+
+    def test_description_line_is_not_parsed_as_marker(self):
+        """Test that the line after a description marker is only a description."""
+        logs = '🔄 Step 1/1\n### Description ###\n{"action": "swipe"}'
+
+        assert parse_step_logs(logs) == [StepInfo(1, 1, '{"action": "swipe"}', None)]
+
+
+class TestExtractStepSummary:
+    """Tests for extract_step_summary."""
+
+    def test_empty_logs(self):
+        """Test that logs without steps give an empty summary."""
+        assert extract_step_summary("nothing happened") == ""
+
+    def test_shortens_long_descriptions(self):
+        """Test that descriptions over 50 characters are cut with an ellipsis."""
+        logs = "\n".join([_step_log(1, 2, "x" * 50), _step_log(2, 2, "y" * 51)])
+
+        assert extract_step_summary(logs) == (
+            f"Step 1/2: {'x' * 50} → Step 2/2: {'y' * 50}..."
+        )
+
+    @pytest.mark.parametrize("count,more", [(5, False), (6, True), (8, True)])
+    def test_lists_at_most_five_steps(self, count, more):
+        """Test that only the first five steps are listed, noting any beyond them."""
+        logs = "\n".join(_step_log(n, count, f"step {n}") for n in range(1, count + 1))
+
+        summary = extract_step_summary(logs)
+
+        expected = " → ".join(f"Step {n}/{count}: step {n}" for n in range(1, 6))
+        assert summary == expected + (" ... (+more steps)" if more else "")
@@ -7,12 +7,21 @@ based on configuration and availability. It handles:
 2. EXECUTION_MODE = "cloud" -> Use MobileRun, with fallback to DroidRun if:
    - MobileRun API fails
    - AND a local ADB device is connected
+
+While MobileRun keeps failing, a circuit breaker sends requests straight to
+the fallback and retries the cloud after a short sleep window.
 """
+import threading
+import time
+from dataclasses import dataclass, field
 from typing import Union, Callable, Any
 from functools import wraps
 
 from job_hunter.config import Config
 
+# Sentinel for lazily created agents that have not been created yet
+_UNSET = object()
+
 
 class AgentError(Exception):
     """Base exception for agent-related errors"""
@@ -72,6 +81,87 @@ def _get_cloud_agent():
         raise CloudAgentError(f"Failed to initialize MobileRun agent: {e}")
 
 
+@dataclass
+class _CircuitBreaker:
+    """
+    Circuit breaker for the primary (cloud) agent.
+
+    CLOSED: calls go through. Opens once at least failure_threshold calls in
+    the rolling window have failed and they make up error_rate of its calls.
+    OPEN: calls are refused until sleep_window seconds have passed.
+    HALF_OPEN: a single probe call is allowed; its outcome closes or re-opens.
+    """
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    failure_threshold: int = 5
+    sleep_window: float = 10.0
+    error_rate: float = 0.5
+    rolling_window: float = 10.0
+
+    state: str = CLOSED
+    failure_count: int = 0
+    request_count: int = 0
+    window_start: float = field(default_factory=time.monotonic)
+    opened_at: float = 0.0
+    _lock: threading.Lock = field(default_factory=threading.Lock, repr=False)
+
+    def allow(self) -> bool:
+        """Whether the next call may go to the primary agent"""
+        with self._lock:
+            if self.state == self.CLOSED:
+                return True
+            if self.state == self.OPEN and time.monotonic() - self.opened_at >= self.sleep_window:
+                self.state = self.HALF_OPEN
+                return True
+            return False
+
+    def record_success(self):
+        with self._lock:
+            if self.state == self.HALF_OPEN:
+                self._reset(self.CLOSED)
+            else:
+                self._count(failed=False)
+
+    def record_failure(self):
+        with self._lock:
+            if self.state == self.HALF_OPEN:
+                self._trip()
+                return
+            self._count(failed=True)
+            if (
+                self.failure_count >= self.failure_threshold
+                and self.failure_count / self.request_count >= self.error_rate
+            ):
+                self._trip()
+
+    def _count(self, failed: bool):
+        now = time.monotonic()
+        if now - self.window_start >= self.rolling_window:
+            self.failure_count = 0
+            self.request_count = 0
+            self.window_start = now
+        self.request_count += 1
+        if failed:
+            self.failure_count += 1
+
+    def _trip(self):
+        self._reset(self.OPEN)
+        self.opened_at = time.monotonic()
+
+    def _reset(self, state: str):
+        self.state = state
+        self.failure_count = 0
+        self.request_count = 0
+        self.window_start = time.monotonic()
+
+
+# Shared by every FallbackAgent so MobileRun's failure history outlives a request
+_cloud_breaker = _CircuitBreaker()
+
+
 class FallbackAgent:
     """
     Wrapper agent that tries MobileRun first, then falls back to DroidRun.
@@ -81,60 +171,74 @@ class FallbackAgent:
     """
 
     def __init__(self):
-        self._primary_agent = None
-        self._fallback_agent = None
+        # Agents are created on first use; _UNSET means none has been created yet
+        self._primary_agent_cached = _UNSET
+        self._fallback_agent_cached = _UNSET
         self._using_fallback = False
-        self._initialize_agents()
-
-    def _initialize_agents(self):
-        """Initialize primary (cloud) and fallback (local) agents"""
-        # Try to initialize primary (cloud) agent
-        try:
-            from job_hunter.mobilerun_agent import MobileRunAgent
-            self._primary_agent = MobileRunAgent()
-            print("FallbackAgent: MobileRun Cloud agent initialized")
-        except Exception as e:
-            print(f"FallbackAgent: MobileRun Cloud failed to initialize: {e}")
-
-        # Check if fallback is available
+        self._breaker = _cloud_breaker
+
+    @property
+    def primary_agent(self):
+        """MobileRun cloud agent, or None if it failed to initialize"""
+        if self._primary_agent_cached is _UNSET:
+            try:
+                from job_hunter.mobilerun_agent import MobileRunAgent
+                self._primary_agent_cached = MobileRunAgent()
+                print("FallbackAgent: MobileRun Cloud agent initialized")
+            except Exception as e:
+                print(f"FallbackAgent: MobileRun Cloud failed to initialize: {e}")
+                self._primary_agent_cached = None
+        return self._primary_agent_cached
+
+    @property
+    def fallback_agent(self):
+        """DroidRun local agent, or None if no device is connected or it is unavailable"""
+        if self._fallback_agent_cached is not _UNSET:
+            return self._fallback_agent_cached
+        # Only a working agent is cached; otherwise the (TTL-cached) device
+        # probe runs again next time, so a device connected later is picked up
         if Config.should_fallback_to_local():
             try:
                 from job_hunter.droidrun_backup import DroidRunAgent
                 agent = DroidRunAgent()
                 if agent.is_available():
-                    self._fallback_agent = agent
+                    self._fallback_agent_cached = agent
                     print("FallbackAgent: DroidRun local fallback available")
+                    return agent
             except Exception as e:
                 print(f"FallbackAgent: DroidRun fallback failed: {e}")
-
-        if not self._primary_agent and not self._fallback_agent:
-            raise AgentError("No agent available: both MobileRun and DroidRun failed")
+        return None
 
     def _execute_with_fallback(self, method_name: str, *args, **kwargs):
-        """Execute a method with automatic fallback"""
-        # Try primary agent first
-        if self._primary_agent and not self._using_fallback:
-            try:
-                method = getattr(self._primary_agent, method_name)
-                return method(*args, **kwargs)
-            except Exception as e:
-                print(f"FallbackAgent: Primary agent failed for {method_name}: {e}")
-                # Check if we should fallback
-                if self._fallback_agent:
-                    print("FallbackAgent: Switching to local DroidRun fallback")
-                    self._using_fallback = True
+        """Execute a method on the primary agent, falling back while its breaker is open"""
+        if self.primary_agent:
+            if self._breaker.allow():
+                try:
+                    method = getattr(self.primary_agent, method_name)
+                    result = method(*args, **kwargs)
+                except Exception as e:
+                    self._breaker.record_failure()
+                    print(f"FallbackAgent: Primary agent failed for {method_name}: {e}")
+                    if not self.fallback_agent:
+                        raise CloudAgentError(f"MobileRun failed and no fallback available: {e}")
+                    print("FallbackAgent: Using local DroidRun fallback")
                 else:
-                    raise CloudAgentError(f"MobileRun failed and no fallback available: {e}")
+                    self._breaker.record_success()
+                    self._using_fallback = False
+                    return result
+            elif not self.fallback_agent:
+                raise CloudAgentError("MobileRun circuit is open and no fallback available")
 
         # Use fallback agent
-        if self._fallback_agent:
+        if self.fallback_agent:
+            self._using_fallback = True
             try:
-                method = getattr(self._fallback_agent, method_name)
+                method = getattr(self.fallback_agent, method_name)
                 return method(*args, **kwargs)
             except Exception as e:
                 raise LocalAgentError(f"DroidRun fallback also failed: {e}")
 
-        raise AgentError("No agent available to execute request")
+        raise AgentError("No agent available: both MobileRun and DroidRun failed")
 
     # Proxy all agent methods
     def create_task(self, *args, **kwargs):
@@ -153,7 +257,7 @@ class FallbackAgent:
         return self._execute_with_fallback("google_search_jobs", *args, **kwargs)
 
     def is_using_fallback(self) -> bool:
-        """Check if currently using fallback agent"""
+        """Check if the last call was served by the fallback agent"""
         return self._using_fallback
 
     def get_agent_type(self) -> str:
@@ -193,6 +297,10 @@ def create_agent(use_fallback: bool = True):
         use_fallback: If True and in cloud mode, enables automatic fallback
                       to local DroidRun if MobileRun fails.
 
+    Each call returns a new agent, so per-request state such as
+    get_agent_type() is not shared between concurrent requests. FallbackAgents
+    share one process-wide circuit breaker.
+
     Returns:
         Agent instance (MobileRunAgent, DroidRunAgent, or FallbackAgent)
     """
@@ -2,11 +2,13 @@
 
 from flask import Flask, render_template, jsonify, request, redirect, url_for
 from flask_cors import CORS
+from pymongo.errors import ServerSelectionTimeoutError
 from job_hunter.config import Config
 from job_hunter.database import MongoDBManager
 from job_hunter.google_sheets import GoogleSheetsManager
 from job_hunter.orchestrator import JobApplicationOrchestrator
 import os
+from functools import lru_cache
 from werkzeug.utils import secure_filename
 from pathlib import Path
 
@@ -36,7 +38,18 @@ CORS(
 os.makedirs(app.config["UPLOAD_FOLDER"], exist_ok=True)
 
 # Initialize managers
-db = MongoDBManager()
+db = MongoDBManager.instance()
+
+
+def _database_unavailable():
+    """Response for requests that could not reach MongoDB"""
+    return jsonify({"success": False, "error": "Database unavailable"}), 503
+
+
+@lru_cache(maxsize=1)
+def _get_sheets_manager() -> GoogleSheetsManager:
+    """Get the shared Google Sheets manager, authenticating on first use"""
+    return GoogleSheetsManager()
 
 
 @app.route("/")
@@ -51,6 +64,8 @@ def get_applications(user_id):
     try:
         applications = db.get_user_applications(user_id)
         return jsonify({"success": True, "applications": applications, "count": len(applications)})
+    except ServerSelectionTimeoutError:
+        return _database_unavailable()
     except Exception as e:
         return jsonify({"success": False, "error": str(e)}), 500
 
@@ -59,7 +74,7 @@ def get_applications(user_id):
 def get_applications_from_sheets():
     """Get applications from Google Sheets"""
     try:
-        sheets = GoogleSheetsManager()
+        sheets = _get_sheets_manager()
         applications = sheets.get_all_applications()
         return jsonify({"success": True, "applications": applications, "count": len(applications)})
     except FileNotFoundError as e:
@@ -93,10 +108,12 @@ def update_application_status(user_id):
         db.update_application_status(user_id, apply_link, new_status)
 
         # Update in Google Sheets
-        sheets = GoogleSheetsManager()
+        sheets = _get_sheets_manager()
         sheets.update_application_status(apply_link, new_status)
 
         return jsonify({"success": True, "message": "Status updated successfully"})
+    except ServerSelectionTimeoutError:
+        return _database_unavailable()
     except Exception as e:
         return jsonify({"success": False, "error": str(e)}), 500
 
@@ -107,6 +124,8 @@ def get_preferences(user_id):
     try:
         preferences = db.get_user_preferences(user_id)
         return jsonify({"success": True, "preferences": preferences or {}})
+    except ServerSelectionTimeoutError:
+        return _database_unavailable()
     except Exception as e:
         return jsonify({"success": False, "error": str(e)}), 500
 
@@ -118,6 +137,8 @@ def save_preferences(user_id):
         preferences = request.json
         db.save_user_preferences(user_id, preferences)
         return jsonify({"success": True, "message": "Preferences saved successfully"})
+    except ServerSelectionTimeoutError:
+        return _database_unavailable()
     except Exception as e:
         return jsonify({"success": False, "error": str(e)}), 500
 
@@ -126,30 +147,10 @@ def save_preferences(user_id):
 def get_stats(user_id):
     """Get application statistics"""
     try:
-        applications = db.get_user_applications(user_id)
-
-        stats = {
-            "total_applications": len(applications),
-            "status_breakdown": {},
-            "job_types": {},
-            "locations": {},
-            "recent_applications": applications[:5] if applications else [],
-        }
-
-        for app in applications:
-            # Status breakdown
-            status = app.get("status", "Unknown")
-            stats["status_breakdown"][status] = stats["status_breakdown"].get(status, 0) + 1
-
-            # Job types
-            job_type = app.get("job_type", "Unknown")
-            stats["job_types"][job_type] = stats["job_types"].get(job_type, 0) + 1
-
-            # Locations
-            location = app.get("location", "Unknown")
-            stats["locations"][location] = stats["locations"].get(location, 0) + 1
-
+        stats = db.get_user_stats(user_id)
         return jsonify({"success": True, "stats": stats})
+    except ServerSelectionTimeoutError:
+        return _database_unavailable()
     except Exception as e:
         return jsonify({"success": False, "error": str(e)}), 500
 
@@ -186,6 +187,8 @@ def upload_resume():
             )
         else:
             return jsonify({"success": False, "error": "Only PDF files are supported"}), 400
+    except ServerSelectionTimeoutError:
+        return _database_unavailable()
     except Exception as e:
         return jsonify({"success": False, "error": str(e)}), 500
 
@@ -196,6 +199,8 @@ def get_job_portals():
     try:
         portals = db.get_all_job_portals()
         return jsonify({"success": True, "portals": portals})
+    except ServerSelectionTimeoutError:
+        return _database_unavailable()
     except Exception as e:
         return jsonify({"success": False, "error": str(e)}), 500
 
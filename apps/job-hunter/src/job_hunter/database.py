@@ -1,15 +1,42 @@
 """MongoDB integration for storing job portals and user preferences"""
-from pymongo import MongoClient
-from typing import Dict, List, Optional
+import threading
 from datetime import datetime
+from typing import Dict, List, Optional
+
+from pymongo import IndexModel, MongoClient
+from pymongo.errors import BulkWriteError
+
 from job_hunter.config import Config
 
 
 class MongoDBManager:
     """Manage MongoDB operations for job portals and user data"""
 
+    _instance: Optional["MongoDBManager"] = None
+    # Reentrant: instance() holds it while __init__ takes it for index creation
+    _instance_lock = threading.RLock()
+    # (uri, db name) pairs whose indexes this process already created
+    _indexed_databases: set = set()
+
+    @classmethod
+    def instance(cls) -> "MongoDBManager":
+        """Get the process-wide manager, sharing one MongoClient connection pool"""
+        if cls._instance is None:
+            with cls._instance_lock:
+                if cls._instance is None:
+                    cls._instance = cls()
+        return cls._instance
+
     def __init__(self):
-        self.client = MongoClient(Config.MONGODB_URI)
+        self.client = MongoClient(
+            Config.MONGODB_URI,
+            maxPoolSize=Config.MONGO_POOL_SIZE,
+            minPoolSize=2,
+            serverSelectionTimeoutMS=Config.MONGO_TIMEOUT_MS,
+            connectTimeoutMS=Config.MONGO_TIMEOUT_MS,
+            socketTimeoutMS=5000,
+            retryWrites=True,
+        )
         self.db = self.client[Config.MONGODB_DB_NAME]
 
         # Collections
@@ -19,66 +46,94 @@ class MongoDBManager:
         self.job_listings = self.db['job_listings']
 
         # Create indexes
-        self._create_indexes()
+        database = (Config.MONGODB_URI, Config.MONGODB_DB_NAME)
+        if database not in MongoDBManager._indexed_databases:
+            with MongoDBManager._instance_lock:
+                if database not in MongoDBManager._indexed_databases:
+                    self._create_indexes()
+                    MongoDBManager._indexed_databases.add(database)
 
     def _create_indexes(self):
         """Create database indexes for better performance"""
         self.job_portals.create_index("url", unique=True)
         self.user_preferences.create_index("user_id", unique=True)
-        self.application_history.create_index([("user_id", 1), ("date_applied", -1)])
-        self.job_listings.create_index([("apply_link", 1), ("user_id", 1)], unique=True)
+        self.application_history.create_indexes([
+            IndexModel([("user_id", 1), ("date_applied", -1)]),
+            # Status updates look applications up by link
+            IndexModel([("user_id", 1), ("apply_link", 1)])
+        ])
+        self.job_listings.create_indexes([
+            IndexModel([("apply_link", 1), ("user_id", 1)], unique=True),
+            # Serves get_cached_jobs' filter and sort
+            IndexModel([("user_id", 1), ("applied", 1), ("cached_date", -1)])
+        ])
 
     # Job Portals Management
     def add_job_portal(self, url: str, name: str, category: Optional[str] = None) -> bool:
         """Add a new job portal to the database"""
         try:
-            portal = {
-                "url": url,
-                "name": name,
-                "category": category,
-                "added_date": datetime.now(),
-                "last_used": None,
-                "success_rate": 0.0,
-                "total_applications": 0
-            }
-            self.job_portals.insert_one(portal)
+            self.job_portals.insert_one(self._portal_doc(url, name, category))
             return True
         except Exception as e:
             print(f"Error adding job portal: {e}")
             return False
 
+    @staticmethod
+    def _portal_doc(url: str, name: str, category: Optional[str]) -> Dict:
+        """Build a new job portal document"""
+        return {
+            "url": url,
+            "name": name,
+            "category": category,
+            "added_date": datetime.now(),
+            "last_used": None,
+            "success_rate": 0.0,
+            "total_applications": 0
+        }
+
     def get_all_job_portals(self) -> List[Dict]:
         """Get all job portals from database"""
         return list(self.job_portals.find({}, {"_id": 0}))
 
     def update_portal_stats(self, url: str, successful: bool = True):
         """Update job portal statistics after application"""
-        portal = self.job_portals.find_one({"url": url})
-        if portal:
-            total = portal.get("total_applications", 0) + 1
-            successful_count = int(portal.get("success_rate", 0) * portal.get("total_applications", 0))
-            if successful:
-                successful_count += 1
-
-            self.job_portals.update_one(
-                {"url": url},
+        # One pipeline update: both fields are computed from the stored values
+        # on the server, so concurrent updates can't overwrite each other
+        total = {"$ifNull": ["$total_applications", 0]}
+        rate = {"$ifNull": ["$success_rate", 0]}
+        self.job_portals.update_one(
+            {"url": url},
+            [
                 {
                     "$set": {
                         "last_used": datetime.now(),
-                        "total_applications": total,
-                        "success_rate": successful_count / total
+                        "total_applications": {"$add": [total, 1]},
+                        "success_rate": {
+                            "$divide": [
+                                {"$add": [{"$multiply": [rate, total]}, 1 if successful else 0]},
+                                {"$add": [total, 1]}
+                            ]
+                        }
                     }
                 }
-            )
+            ]
+        )
 
     def initialize_default_portals(self):
         """Initialize database with default job portals"""
-        for url in Config.DEFAULT_JOB_PORTALS:
-            name = url.split("//")[1].split("/")[0].replace("www.", "").title()
-            try:
-                self.add_job_portal(url, name, category="General")
-            except:
-                pass  # Portal already exists
+        docs = [
+            self._portal_doc(
+                url, url.split("//")[1].split("/")[0].replace("www.", "").title(), "General"
+            )
+            for url in Config.DEFAULT_JOB_PORTALS
+        ]
+        try:
+            # Unordered, so portals that already exist don't stop the rest
+            self.job_portals.insert_many(docs, ordered=False)
+        except BulkWriteError as e:
+            errors = [err for err in e.details.get("writeErrors", []) if err.get("code") != 11000]
+            if errors or e.details.get("writeConcernErrors"):
+                print(f"Error initializing default job portals: {errors or e.details}")
 
     # User Preferences Management
     def save_user_preferences(self, user_id: str, preferences: Dict) -> bool:
@@ -161,6 +216,34 @@ class MongoDBManager:
             {"$set": {"status": status}}
         )
 
+    def get_user_stats(self, user_id: str) -> Dict:
+        """Get application statistics for a user, aggregated in one query"""
+        def count_by(field: str) -> List[Dict]:
+            return [{"$group": {"_id": {"$ifNull": [f"${field}", "Unknown"]}, "count": {"$sum": 1}}}]
+
+        result = next(self.application_history.aggregate([
+            {"$match": {"user_id": user_id}},
+            {"$facet": {
+                "total": [{"$count": "count"}],
+                "status_breakdown": count_by("status"),
+                "job_types": count_by("job_type"),
+                "locations": count_by("location"),
+                "recent": [
+                    {"$sort": {"date_applied": -1}},
+                    {"$limit": 5},
+                    {"$project": {"_id": 0}}
+                ]
+            }}
+        ]))
+
+        return {
+            "total_applications": result["total"][0]["count"] if result["total"] else 0,
+            "status_breakdown": {g["_id"]: g["count"] for g in result["status_breakdown"]},
+            "job_types": {g["_id"]: g["count"] for g in result["job_types"]},
+            "locations": {g["_id"]: g["count"] for g in result["locations"]},
+            "recent_applications": result["recent"]
+        }
+
     def get_application_count(self, user_id: str) -> int:
         """Get total number of applications for user"""
         return self.application_history.count_documents({"user_id": user_id})
@@ -45,16 +45,40 @@ class MobileRunClient:
     - Retrieve screenshots and trajectories
     """
 
-    def __init__(self, api_key: str, base_url: str = MOBILERUN_API_URL):
+    def __init__(
+        self,
+        api_key: str,
+        base_url: str = MOBILERUN_API_URL,
+        http_client: Optional[httpx.AsyncClient] = None,
+    ):
         """
         Initialize MobileRun client.
 
         Args:
             api_key: MobileRun API key
             base_url: API base URL (default: https://api.mobilerun.ai)
+            http_client: Shared httpx client to use (default: a pooled client owned by
+                this instance and closed by aclose())
         """
         self.api_key = api_key
         self.base_url = base_url.rstrip("/")
+        self._http = http_client
+        self._owns_http = http_client is None
+
+    def _get_http(self) -> httpx.AsyncClient:
+        """Get the pooled HTTP client, creating it on first use."""
+        if self._http is None:
+            self._http = httpx.AsyncClient(
+                limits=httpx.Limits(max_keepalive_connections=20, max_connections=100),
+                timeout=httpx.Timeout(60.0, connect=10.0),
+            )
+        return self._http
+
+    async def aclose(self) -> None:
+        """Close the HTTP client if this instance owns it."""
+        if self._owns_http and self._http is not None:
+            await self._http.aclose()
+            self._http = None
 
     def _get_headers(self) -> dict:
         """Get authorization headers."""
@@ -74,16 +98,16 @@ class MobileRunClient:
         """Make an API request."""
         url = f"{self.base_url}{endpoint}"
 
-        async with httpx.AsyncClient(timeout=timeout) as client:
-            response = await client.request(
-                method,
-                url,
-                headers=self._get_headers(),
-                json=json,
-                params=params,
-            )
-            response.raise_for_status()
-            return response.json() if response.content else {}
+        response = await self._get_http().request(
+            method,
+            url,
+            headers=self._get_headers(),
+            json=json,
+            params=params,
+            timeout=timeout,
+        )
+        response.raise_for_status()
+        return response.json() if response.content else {}
 
     # ============ Device Management ============
 
@@ -245,19 +269,19 @@ class MobileRunClient:
 
         url = f"{self.base_url}/v1/tasks/stream"
 
-        async with httpx.AsyncClient(timeout=None) as client:
-            async with client.stream(
-                "POST",
-                url,
-                headers=self._get_headers(),
-                json=payload,
-            ) as response:
-                response.raise_for_status()
-                async for line in response.aiter_lines():
-                    if line.startswith("data:"):
-                        import json
-
-                        yield json.loads(line[5:].strip())
+        async with self._get_http().stream(
+            "POST",
+            url,
+            headers=self._get_headers(),
+            json=payload,
+            timeout=None,
+        ) as response:
+            response.raise_for_status()
+            async for line in response.aiter_lines():
+                if line.startswith("data:"):
+                    import json
+
+                    yield json.loads(line[5:].strip())
 
     async def get_task(self, task_id: str) -> Task:
         """Get task details."""